@@ -0,0 +1,58 @@
+"""Login and user profile commands."""
+
+import click
+
+from lib._commands.common import (
+    RISK_CHOICE, check_email, check_name, get_app, get_logged_in_cli,
+    write_session_user_id
+)
+
+
+@click.command()
+@click.option('--name', prompt='Your name', callback=check_name, help='Your full name')
+@click.option('--email', prompt='Your email', callback=check_email, help='Your email address')
+def login(name, email):
+    """Login or create a new user account."""
+    try:
+        cli_app = get_app()
+        user = cli_app.get_or_create_user(name, email)
+        
+        # Store user session (simplified for demo)
+        write_session_user_id(cli_app.current_user_id)
+        
+        click.echo("✓ Login successful!")
+        
+    except Exception as e:
+        click.echo(f"Error during login: {str(e)}")
+
+
+@click.command()
+@click.option('--phone', help='Phone number', default=None)
+@click.option('--address', help='Address', default=None)
+@click.option('--occupation', help='Occupation', default=None)
+@click.option('--annual-income', help='Annual income', type=float, default=None)
+@click.option('--financial-goal', help='Financial goal', default=None)
+@click.option('--risk-tolerance', help='Risk tolerance', 
+              type=RISK_CHOICE, default=None)
+def create_profile(phone, address, occupation, annual_income, financial_goal, risk_tolerance):
+    """Create or update user profile."""
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    # Options left unset stay None, and create_user_profile skips those,
+    # so an explicit --annual-income 0 is still saved
+    cli_app.create_user_profile(
+        phone=phone, address=address, occupation=occupation, annual_income=annual_income,
+        financial_goal=financial_goal, risk_tolerance=risk_tolerance
+    )
+
+
+@click.command()
+def view_profile():
+    """View user profile information."""
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    cli_app.view_user_profile()
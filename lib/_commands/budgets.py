@@ -0,0 +1,40 @@
+"""Budget and report commands."""
+
+import click
+
+from lib._commands.common import check_amount, check_category, check_month, get_logged_in_cli
+
+
+@click.command()
+@click.option('--category', prompt='Category', callback=check_category, help='Budget category')
+@click.option('--limit', prompt='Monthly limit', callback=check_amount, help='Budget limit amount')
+@click.option('--month', help='Month (YYYY-MM)', default=None, callback=check_month)
+def add_budget(category, limit, month):
+    """Add or update a budget."""
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    cli_app.add_budget(category, limit, month)
+
+
+@click.command()
+@click.option('--month', help='Month (YYYY-MM)', default=None, callback=check_month)
+def view_budgets(month):
+    """View budgets and spending."""
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    cli_app.view_budgets(month)
+
+
+@click.command()
+@click.option('--month', help='Month (YYYY-MM)', default=None, callback=check_month)
+def generate_report(month):
+    """Generate comprehensive financial report."""
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    cli_app.generate_report(month)
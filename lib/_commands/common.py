@@ -0,0 +1,127 @@
+"""Helpers shared by the CLI command modules."""
+
+import functools
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import click
+
+from lib.helpers import (
+    validate_amount, validate_email, validate_category, 
+    validate_date, validate_month, validate_name, validate_description
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_app():
+    """Create the process-wide FinanceTrackerCLI, importing it on first use.
+    
+    Keeps SQLAlchemy, the models and Rich out of commands that never touch
+    the database, such as --help and the migration commands.
+    """
+    from lib.finance_cli import FinanceTrackerCLI
+    
+    return FinanceTrackerCLI()
+
+
+def get_app():
+    """Return the shared FinanceTrackerCLI with a session open for this invocation."""
+    ctx = click.get_current_context().find_root()
+    if ctx.obj is None:
+        # One session for the whole invocation, committed when Click closes the context
+        ctx.obj = ctx.with_resource(_shared_app())
+    return ctx.obj
+
+
+# The session file holds just the logged-in user's id
+_SESSION_FILE = '.current_user'
+_UNREAD = object()
+# Read at most once per process; None caches "not logged in"
+_SESSION_CACHE = _UNREAD
+
+
+def read_session_user_id() -> Optional[int]:
+    """Return the logged-in user id, reading the session file on first use only."""
+    global _SESSION_CACHE
+    if _SESSION_CACHE is _UNREAD:
+        try:
+            # Older session files hold "id,name,email"; only the id is needed
+            _SESSION_CACHE = int(Path(_SESSION_FILE).read_text().split(',', 1)[0])
+        except (FileNotFoundError, ValueError):
+            _SESSION_CACHE = None
+    return _SESSION_CACHE
+
+
+def write_session_user_id(user_id: int):
+    """Store the logged-in user id in the session file and the cache."""
+    global _SESSION_CACHE
+    # Logging in again as the same user leaves the file alone
+    if read_session_user_id() == user_id:
+        return
+    
+    # Write a temp file and rename it over the old one, so a crash can never
+    # leave a truncated session file behind
+    tmp_path = _SESSION_FILE + '.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        os.write(fd, str(user_id).encode())
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, _SESSION_FILE)
+    _SESSION_CACHE = user_id
+
+
+def get_logged_in_cli():
+    """Get CLI instance with logged in user."""
+    user_id = read_session_user_id()
+    if user_id is not None:
+        cli_app = get_app()
+        cli_app.current_user_id = user_id
+        return cli_app
+    
+    err("Not logged in. Please run 'python -m lib.cli login' first.")
+    return None
+
+
+def err(msg: str):
+    """Echo a user-facing error line."""
+    click.echo("Error: " + msg)
+
+
+def split_tags(tags: str) -> List[str]:
+    """Split a comma-separated tag string, dropping blanks."""
+    if not tags:
+        return []
+    return list(filter(None, map(str.strip, tags.split(','))))
+
+
+def validator_callback(validator):
+    """Adapt a (is_valid, value_or_error) validator into a Click option callback.
+    
+    Click runs the callback while parsing, so a bad value is reported (or
+    re-prompted) before the command body starts. Unset options pass through.
+    """
+    def callback(ctx, param, value):
+        if value is None:
+            return None
+        is_valid, result = validator(value)
+        if not is_valid:
+            raise click.BadParameter(result)
+        return result
+    return callback
+
+
+check_amount = validator_callback(validate_amount)
+check_category = validator_callback(validate_category)
+check_description = validator_callback(validate_description)
+check_date = validator_callback(validate_date)
+check_month = validator_callback(validate_month)
+check_name = validator_callback(validate_name)
+check_email = validator_callback(validate_email)
+
+# Shared by the command options and the interactive prompts
+TXN_TYPES = ('income', 'expense')
+RISK_LEVELS = ('low', 'medium', 'high')
+TXN_TYPE_CHOICE = click.Choice(TXN_TYPES)
+RISK_CHOICE = click.Choice(RISK_LEVELS)
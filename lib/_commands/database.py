@@ -0,0 +1,79 @@
+"""Database initialization and Alembic migration commands."""
+
+import click
+
+
+@click.command()
+@click.option('--use-alembic/--no-alembic', default=True, help='Use Alembic migrations (default: True)')
+def init(use_alembic):
+    """Initialize the database."""
+    from lib.db.models import init_db, init_db_with_alembic
+    
+    try:
+        if use_alembic:
+            init_db_with_alembic()
+        else:
+            init_db()
+        click.echo("✓ Database initialized successfully!")
+    except Exception as e:
+        click.echo(f"Error initializing database: {str(e)}")
+
+
+@click.command()
+@click.option('--message', '-m', prompt='Migration message', help='Description of the migration')
+def create_migration(message):
+    """Create a new Alembic migration."""
+    try:
+        from alembic import command
+        from lib.db.models import get_alembic_config
+        
+        # Create new migration
+        command.revision(get_alembic_config(), message=message, autogenerate=True)
+        click.echo(f"✓ Migration '{message}' created successfully!")
+        
+    except Exception as e:
+        click.echo(f"Error creating migration: {str(e)}")
+
+
+@click.command()
+@click.option('--revision', default='head', help='Target revision (default: head)')
+def migrate(revision):
+    """Run Alembic migrations."""
+    try:
+        from alembic import command
+        from lib.db.models import get_alembic_config
+        
+        # Run migrations
+        command.upgrade(get_alembic_config(), revision)
+        click.echo(f"✓ Migrations applied to {revision}!")
+        
+    except Exception as e:
+        click.echo(f"Error running migrations: {str(e)}")
+
+
+@click.command()
+def migration_history():
+    """Show Alembic migration history."""
+    try:
+        from alembic import command
+        from lib.db.models import get_alembic_config
+        
+        # Show history
+        command.history(get_alembic_config())
+        
+    except Exception as e:
+        click.echo(f"Error showing migration history: {str(e)}")
+
+
+@click.command()
+def migration_current():
+    """Show current migration revision."""
+    try:
+        from alembic import command
+        from lib.db.models import get_alembic_config
+        
+        # Show current revision
+        command.current(get_alembic_config())
+        
+    except Exception as e:
+        click.echo(f"Error showing current revision: {str(e)}")
@@ -0,0 +1,40 @@
+"""Savings goal commands."""
+
+import click
+
+from lib._commands.common import check_amount, check_description, check_name, get_logged_in_cli
+
+
+@click.command()
+@click.option('--name', prompt='Goal name', callback=check_name, help='Savings goal name')
+@click.option('--target', prompt='Target amount', callback=check_amount, help='Target amount to save')
+@click.option('--description', help='Goal description', default='', callback=check_description)
+def add_savings_goal(name, target, description):
+    """Add a new savings goal."""
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    cli_app.add_savings_goal(name, target, description)
+
+
+@click.command()
+@click.option('--name', prompt='Goal name', help='Savings goal name')
+@click.option('--amount', prompt='Amount to add', callback=check_amount, help='Amount to contribute')
+def update_savings_goal(name, amount):
+    """Update progress on a savings goal."""
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    cli_app.update_savings_goal(name, amount)
+
+
+@click.command()
+def view_savings_goals():
+    """View all savings goals."""
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    cli_app.view_savings_goals()
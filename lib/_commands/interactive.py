@@ -0,0 +1,289 @@
+"""Interactive menu mode."""
+
+import click
+
+from lib._commands.common import (
+    RISK_LEVELS, TXN_TYPES, err, get_logged_in_cli, split_tags
+)
+from lib.helpers import validate_amount, validate_category, validate_description, validate_name
+
+
+@click.command()
+def interactive():
+    """Start interactive mode."""
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    try:
+        # Line editing and history for the prompts; not available everywhere
+        import readline
+        readline.set_history_length(1000)
+    except ImportError:
+        pass
+    
+    click.echo("🏦 Personal Finance Tracker - Interactive Mode")
+    click.echo("=" * 50)
+    
+    while True:
+        click.echo("\n--- Main Menu ---")
+        click.echo(_MENU_TEXT)
+        
+        try:
+            raw = input(_CHOICE_PROMPT).strip()
+            choice = int(raw) if raw.isdigit() else -1
+            
+            if not 1 <= choice <= len(_MENU):
+                click.echo(f"Invalid choice. Please enter a number between 1-{len(_MENU)}.")
+                continue
+            
+            handler = _MENU[choice - 1][1]
+            if handler is None:
+                click.echo("Thank you for using Personal Finance Tracker! 💰")
+                break
+            handler(cli_app)
+            
+            # Persist each action as it completes rather than at exit
+            cli_app.commit()
+                
+        except (ValueError, KeyboardInterrupt, EOFError):
+            click.echo("\nThank you for using Personal Finance Tracker! 💰")
+            break
+
+
+def _prompt(text: str, default=None, choices=None, value_type=str, show_default: bool = True):
+    """Read one value with input(), re-asking until it is usable.
+    
+    A lighter stand-in for click.prompt in the interactive loop. Empty input
+    returns the default when there is one; end of input raises
+    KeyboardInterrupt so callers treat it like Ctrl-C.
+    """
+    prompt_text = text
+    if choices:
+        prompt_text += f" ({', '.join(choices)})"
+    if default is not None and show_default:
+        prompt_text += f" [{default}]"
+    prompt_text += ": "
+    
+    while True:
+        try:
+            value = input(prompt_text)
+        except EOFError:
+            raise KeyboardInterrupt
+        
+        if not value:
+            if default is not None:
+                return default
+            continue
+        
+        if choices and value not in choices:
+            err(f"'{value}' is not one of {', '.join(choices)}.")
+            continue
+        
+        try:
+            return value_type(value)
+        except ValueError:
+            err(f"'{value}' is not a valid {value_type.__name__}.")
+
+
+def _prompt_optional(text: str, **kwargs):
+    """Like _prompt, but empty input returns None so the field is left unset."""
+    value = _prompt(text, default="", show_default=False, **kwargs)
+    return None if value == "" else value
+
+
+def _interactive_add_transaction_impl(cli_app, with_tags: bool):
+    """Prompt for a transaction, plus tags when with_tags is set, and add it."""
+    try:
+        transaction_type = _prompt("Type", choices=TXN_TYPES)
+        amount = _prompt("Amount")
+        category = _prompt("Category")
+        description = _prompt("Description")
+        if with_tags:
+            tags = _prompt("Tags (comma-separated, optional)", default="", show_default=False)
+        
+        # Validate
+        amount_valid, amount_result = validate_amount(amount)
+        if not amount_valid:
+            err(amount_result)
+            return
+        
+        category_valid, category_result = validate_category(category)
+        if not category_valid:
+            err(category_result)
+            return
+        
+        desc_valid, desc_result = validate_description(description)
+        if not desc_valid:
+            err(desc_result)
+            return
+        
+        if with_tags:
+            cli_app.add_transaction_with_tags(amount_result, category_result, desc_result, 
+                                             transaction_type, split_tags(tags))
+        else:
+            cli_app.add_transaction(amount_result, category_result, desc_result, transaction_type)
+        
+    except (ValueError, KeyboardInterrupt):
+        click.echo("Operation cancelled.")
+
+
+def _interactive_add_transaction(cli_app):
+    """Interactive transaction addition."""
+    _interactive_add_transaction_impl(cli_app, with_tags=False)
+
+
+def _interactive_add_budget(cli_app):
+    """Interactive budget addition."""
+    try:
+        category = _prompt("Category")
+        limit_amount = _prompt("Monthly limit")
+        
+        # Validate
+        limit_valid, limit_result = validate_amount(limit_amount)
+        if not limit_valid:
+            err(limit_result)
+            return
+        
+        category_valid, category_result = validate_category(category)
+        if not category_valid:
+            err(category_result)
+            return
+        
+        cli_app.add_budget(category_result, limit_result)
+        
+    except (ValueError, KeyboardInterrupt):
+        click.echo("Operation cancelled.")
+
+
+def _interactive_add_savings_goal(cli_app):
+    """Interactive savings goal addition."""
+    try:
+        name = _prompt("Goal name")
+        target = _prompt("Target amount")
+        description = _prompt("Description (optional)", default="", show_default=False)
+        
+        # Validate
+        name_valid, name_result = validate_name(name)
+        if not name_valid:
+            err(name_result)
+            return
+        
+        target_valid, target_result = validate_amount(target)
+        if not target_valid:
+            err(target_result)
+            return
+        
+        desc_valid, desc_result = validate_description(description)
+        if not desc_valid:
+            err(desc_result)
+            return
+        
+        cli_app.add_savings_goal(name_result, target_result, desc_result)
+        
+    except (ValueError, KeyboardInterrupt):
+        click.echo("Operation cancelled.")
+
+
+def _interactive_update_savings_goal(cli_app):
+    """Interactive savings goal update."""
+    try:
+        name = _prompt("Goal name")
+        amount = _prompt("Amount to add")
+        
+        # Validate
+        amount_valid, amount_result = validate_amount(amount)
+        if not amount_valid:
+            err(amount_result)
+            return
+        
+        cli_app.update_savings_goal(name, amount_result)
+        
+    except (ValueError, KeyboardInterrupt):
+        click.echo("Operation cancelled.")
+
+
+def _interactive_add_tag(cli_app):
+    """Interactive tag addition."""
+    try:
+        name = _prompt("Tag name")
+        description = _prompt("Description (optional)", default="", show_default=False)
+        color = _prompt("Color (hex code)", default="#007bff", show_default=False)
+        
+        cli_app.add_tag(name, description, color)
+        
+    except (ValueError, KeyboardInterrupt):
+        click.echo("Operation cancelled.")
+
+
+def _interactive_add_transaction_with_tags(cli_app):
+    """Interactive transaction addition with tags."""
+    _interactive_add_transaction_impl(cli_app, with_tags=True)
+
+
+def _interactive_create_profile(cli_app):
+    """Interactive profile creation/update."""
+    try:
+        phone = _prompt_optional("Phone number (optional)")
+        address = _prompt_optional("Address (optional)")
+        occupation = _prompt_optional("Occupation (optional)")
+        annual_income = _prompt_optional("Annual income (optional)", value_type=float)
+        financial_goal = _prompt_optional("Financial goal (optional)")
+        risk_tolerance = _prompt_optional("Risk tolerance (optional)", choices=RISK_LEVELS)
+        
+        cli_app.create_user_profile(
+            phone=phone, address=address, occupation=occupation, annual_income=annual_income,
+            financial_goal=financial_goal, risk_tolerance=risk_tolerance
+        )
+        
+    except (ValueError, KeyboardInterrupt):
+        click.echo("Operation cancelled.")
+
+
+def _interactive_view_transactions(cli_app):
+    """Interactive transaction listing."""
+    limit = _prompt("Number of transactions to show", default=10, value_type=int)
+    cli_app.view_transactions(limit)
+
+
+def _interactive_view_budgets(cli_app):
+    """Interactive budget overview."""
+    month = _prompt("Month (YYYY-MM)", default="", show_default=False)
+    cli_app.view_budgets(month if month else None)
+
+
+def _interactive_view_savings_goals(cli_app):
+    """Interactive savings goals listing."""
+    cli_app.view_savings_goals()
+
+
+def _interactive_view_profile(cli_app):
+    """Interactive profile display."""
+    cli_app.view_user_profile()
+
+
+def _interactive_generate_report(cli_app):
+    """Interactive financial report."""
+    month = _prompt("Month (YYYY-MM)", default="", show_default=False)
+    cli_app.generate_report(month if month else None)
+
+
+# Interactive menu entries as (label, handler); a None handler exits
+_MENU = (
+    ("Add Transaction", _interactive_add_transaction),
+    ("Add Transaction with Tags", _interactive_add_transaction_with_tags),
+    ("View Transactions", _interactive_view_transactions),
+    ("Add Tag", _interactive_add_tag),
+    ("Add Budget", _interactive_add_budget),
+    ("View Budgets", _interactive_view_budgets),
+    ("Add Savings Goal", _interactive_add_savings_goal),
+    ("Update Savings Goal", _interactive_update_savings_goal),
+    ("View Savings Goals", _interactive_view_savings_goals),
+    ("View Profile", _interactive_view_profile),
+    ("Create/Update Profile", _interactive_create_profile),
+    ("Generate Report", _interactive_generate_report),
+    ("Exit", None),
+)
+# The menu never changes, so it is formatted once at import
+_MENU_TEXT = "\n".join(f"{i}. {label}" for i, (label, _) in enumerate(_MENU, 1))
+_CHOICE_PROMPT = f"\nEnter your choice (1-{len(_MENU)}): "
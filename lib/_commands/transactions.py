@@ -0,0 +1,139 @@
+"""Transaction and tag commands."""
+
+import csv
+
+import click
+
+from lib._commands.common import (
+    TXN_TYPE_CHOICE, check_amount, check_category, check_date, check_description,
+    get_logged_in_cli, split_tags
+)
+from lib.helpers import validate_amount, validate_category, validate_date, validate_description
+
+
+@click.command()
+@click.option('--amount', prompt='Amount', callback=check_amount, help='Transaction amount')
+@click.option('--category', prompt='Category', callback=check_category, help='Transaction category')
+@click.option('--description', prompt='Description', callback=check_description, help='Transaction description')
+@click.option('--type', 'transaction_type', prompt='Type (income/expense)', 
+              type=TXN_TYPE_CHOICE, help='Transaction type')
+@click.option('--date', 'trans_date', help='Transaction date (YYYY-MM-DD)', default=None,
+              callback=check_date)
+def add_transaction(amount, category, description, transaction_type, trans_date):
+    """Add a new transaction."""
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    cli_app.add_transaction(amount, category, description, 
+                           transaction_type, trans_date)
+
+
+@click.command()
+@click.argument('csv_path', type=click.Path(exists=True, dir_okay=False))
+def import_csv(csv_path):
+    """Import transactions from a CSV file.
+    
+    The file needs amount, category, description and type (income/expense)
+    columns, plus an optional date column (YYYY-MM-DD). Invalid rows are
+    listed and skipped; the rest are added in one batch.
+    """
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    from lib.finance_cli import parse_transaction_type
+    
+    # (CSV column, Transaction field, validator)
+    fields = (
+        ('amount', 'amount', validate_amount),
+        ('category', 'category', validate_category),
+        ('description', 'description', validate_description),
+    )
+    
+    rows = []
+    errors = []
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        # Line 1 is the header, so data starts on line 2; every row is checked
+        # so all problems are reported together rather than one per run
+        for line_no, record in enumerate(csv.DictReader(f), 2):
+            row = {}
+            row_errors = []
+            for column, field, validator in fields:
+                is_valid, result = validator(record.get(column) or '')
+                if is_valid:
+                    row[field] = result
+                else:
+                    row_errors.append(result)
+            
+            try:
+                row['transaction_type'] = parse_transaction_type((record.get('type') or '').strip())
+            except ValueError as e:
+                row_errors.append(str(e))
+            
+            if record.get('date'):
+                date_valid, date_result = validate_date(record['date'])
+                if date_valid:
+                    row['transaction_date'] = date_result
+                else:
+                    row_errors.append(date_result)
+            
+            if row_errors:
+                errors.append(f"Line {line_no}: {'; '.join(row_errors)}")
+            else:
+                rows.append(row)
+    
+    if errors:
+        click.echo(f"Skipping {len(errors)} invalid row(s):")
+        click.echo("\n".join(errors))
+    
+    if not rows:
+        click.echo("No valid transactions found in file.")
+        return
+    
+    cli_app.add_transactions_bulk(rows)
+
+
+@click.command()
+@click.option('--limit', default=10, help='Number of transactions to show')
+def view_transactions(limit):
+    """View recent transactions."""
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    cli_app.view_transactions(limit)
+
+
+@click.command()
+@click.option('--name', prompt='Tag name', help='Tag name')
+@click.option('--description', help='Tag description', default='')
+@click.option('--color', help='Tag color (hex code)', default='#007bff')
+def add_tag(name, description, color):
+    """Add a new tag for transactions."""
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    cli_app.add_tag(name, description, color)
+
+
+@click.command()
+@click.option('--amount', prompt='Amount', callback=check_amount, help='Transaction amount')
+@click.option('--category', prompt='Category', callback=check_category, help='Transaction category')
+@click.option('--description', prompt='Description', callback=check_description, help='Transaction description')
+@click.option('--type', 'transaction_type', prompt='Type (income/expense)', 
+              type=TXN_TYPE_CHOICE, help='Transaction type')
+@click.option('--tags', help='Comma-separated tag names', default='')
+@click.option('--date', 'trans_date', help='Transaction date (YYYY-MM-DD)', default=None,
+              callback=check_date)
+def add_transaction_with_tags(amount, category, description, transaction_type, tags, trans_date):
+    """Add a new transaction with tags."""
+    cli_app = get_logged_in_cli()
+    if not cli_app:
+        return
+    
+    tag_names = split_tags(tags)
+    
+    cli_app.add_transaction_with_tags(amount, category, description, 
+                                     transaction_type, tag_names, trans_date)
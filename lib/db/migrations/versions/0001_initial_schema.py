@@ -0,0 +1,140 @@
+"""initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-14 08:47:45.005761
+
+The schema as the original init_db() created it, including the ix_*_id
+indexes that BaseModel's index=True used to add. Databases made that way
+already have some or all of these tables, so existing tables are left
+alone and the rest are created.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    
+    if 'tags' not in existing:
+        op.create_table('tags',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('color', sa.String(length=7), nullable=True),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.Date(), nullable=True),
+        sa.Column('updated_at', sa.Date(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+        )
+        op.create_index('ix_tags_id', 'tags', ['id'], unique=False)
+    
+    if 'users' not in existing:
+        op.create_table('users',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('email', sa.String(length=255), nullable=False),
+        sa.Column('default_currency', sa.String(length=3), nullable=False),
+        sa.Column('monthly_income', sa.Float(), nullable=True),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.Date(), nullable=True),
+        sa.Column('updated_at', sa.Date(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('email')
+        )
+        op.create_index('ix_users_id', 'users', ['id'], unique=False)
+    
+    if 'budgets' not in existing:
+        op.create_table('budgets',
+        sa.Column('category', sa.String(length=100), nullable=False),
+        sa.Column('limit_amount', sa.Float(), nullable=False),
+        sa.Column('month', sa.String(length=7), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.Date(), nullable=True),
+        sa.Column('updated_at', sa.Date(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_budgets_id', 'budgets', ['id'], unique=False)
+    
+    if 'savings_goals' not in existing:
+        op.create_table('savings_goals',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('target_amount', sa.Float(), nullable=False),
+        sa.Column('current_amount', sa.Float(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('is_achieved', sa.Boolean(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.Date(), nullable=True),
+        sa.Column('updated_at', sa.Date(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_savings_goals_id', 'savings_goals', ['id'], unique=False)
+    
+    if 'transactions' not in existing:
+        op.create_table('transactions',
+        sa.Column('amount', sa.Float(), nullable=False),
+        sa.Column('description', sa.String(length=255), nullable=False),
+        sa.Column('category', sa.String(length=100), nullable=False),
+        sa.Column('transaction_type', sa.Enum('INCOME', 'EXPENSE', name='transactiontype'), nullable=False),
+        sa.Column('transaction_date', sa.Date(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.Date(), nullable=True),
+        sa.Column('updated_at', sa.Date(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_transactions_id', 'transactions', ['id'], unique=False)
+    
+    if 'user_profiles' not in existing:
+        op.create_table('user_profiles',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('phone_number', sa.String(length=20), nullable=True),
+        sa.Column('address', sa.Text(), nullable=True),
+        sa.Column('occupation', sa.String(length=100), nullable=True),
+        sa.Column('annual_income', sa.Float(), nullable=True),
+        sa.Column('financial_goal', sa.Text(), nullable=True),
+        sa.Column('risk_tolerance', sa.String(length=20), nullable=True),
+        sa.Column('currency_preference', sa.String(length=3), nullable=True),
+        sa.Column('notifications_enabled', sa.Boolean(), nullable=True),
+        sa.Column('dark_mode', sa.Boolean(), nullable=True),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.Date(), nullable=True),
+        sa.Column('updated_at', sa.Date(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id')
+        )
+        op.create_index('ix_user_profiles_id', 'user_profiles', ['id'], unique=False)
+    
+    if 'transaction_tags' not in existing:
+        op.create_table('transaction_tags',
+        sa.Column('transaction_id', sa.Integer(), nullable=False),
+        sa.Column('tag_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['transaction_id'], ['transactions.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('transaction_id', 'tag_id')
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Dropping a table drops its indexes with it
+    for table_name in ('transaction_tags', 'user_profiles', 'transactions',
+                       'savings_goals', 'budgets', 'users', 'tags'):
+        op.drop_table(table_name)
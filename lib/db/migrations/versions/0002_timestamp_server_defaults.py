@@ -0,0 +1,47 @@
+"""timestamp server defaults
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-14 08:55:12.418305
+
+Give created_at and updated_at a CURRENT_DATE server default on every
+table, matching BaseModel. SQLite cannot alter a column default in place,
+so batch mode rebuilds each table.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every table built on BaseModel
+_TABLES = ('users', 'user_profiles', 'tags', 'transactions', 'budgets', 'savings_goals')
+
+
+def _set_timestamp_default(server_default) -> None:
+    for table_name in _TABLES:
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            for column_name in ('created_at', 'updated_at'):
+                batch_op.alter_column(
+                    column_name,
+                    existing_type=sa.Date(),
+                    existing_nullable=True,
+                    server_default=server_default
+                )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _set_timestamp_default(sa.text('(CURRENT_DATE)'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _set_timestamp_default(None)
@@ -0,0 +1,61 @@
+"""composite query indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-14 09:20:31.207514
+
+Add the per-user composite indexes the models declare and drop the
+single-column ix_*_id indexes, which duplicate each table's primary key.
+Both steps check what the database already has, since tables created by
+init_db() after these model changes start with the new indexes.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns), matching the Index() entries in models.py
+_COMPOSITE_INDEXES = (
+    ('ix_tx_user_date', 'transactions', ['user_id', 'transaction_date']),
+    ('ix_tx_user_cat_date', 'transactions', ['user_id', 'category', 'transaction_date']),
+    ('ix_tx_user_type_date', 'transactions', ['user_id', 'transaction_type', 'transaction_date']),
+    ('ix_budget_user_cat_month', 'budgets', ['user_id', 'category', 'month']),
+    ('ix_budget_user_month', 'budgets', ['user_id', 'month']),
+    ('ix_transaction_tags_tag_txn', 'transaction_tags', ['tag_id', 'transaction_id']),
+)
+
+# Tables whose id column had index=True in BaseModel
+_ID_INDEX_TABLES = ('users', 'user_profiles', 'tags', 'transactions', 'budgets', 'savings_goals')
+
+
+def _index_names(table_name: str) -> set:
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for index_name, table_name, columns in _COMPOSITE_INDEXES:
+        if index_name not in _index_names(table_name):
+            op.create_index(index_name, table_name, columns, unique=False)
+
+    for table_name in _ID_INDEX_TABLES:
+        index_name = f'ix_{table_name}_id'
+        if index_name in _index_names(table_name):
+            op.drop_index(index_name, table_name=table_name)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in _ID_INDEX_TABLES:
+        op.create_index(f'ix_{table_name}_id', table_name, ['id'], unique=False)
+
+    for index_name, table_name, _ in reversed(_COMPOSITE_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
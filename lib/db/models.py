@@ -1,21 +1,49 @@
 """Database models for the finance tracker application."""
 
 import enum
+import functools
+import os
 from datetime import datetime, date
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Union, Tuple
 from collections import defaultdict
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, Date, Enum, Text, Boolean, ForeignKey, Table
+from sqlalchemy import create_engine, case, event, func, insert, select, Column, Integer, String, Float, Date, Enum, Text, Boolean, ForeignKey, Table, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import sessionmaker, relationship, column_property, Session
+from sqlalchemy.pool import QueuePool
 
 # Database configuration
 DATABASE_URL = "sqlite:///finance_tracker.db"
-engine = create_engine(DATABASE_URL, echo=False)
+# Pooled connections outlive sessions, so each get_db_session() reuses an
+# open SQLite connection (and its page cache) instead of reconnecting
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    connect_args={'check_same_thread': False},
+    poolclass=QueuePool,
+    pool_size=5,
+    max_overflow=10
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Seeding reads nothing back after its commit, so nothing needs expiring
+SeedSession = sessionmaker(autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
 
 
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection: WAL, fewer fsyncs, bigger caches."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
 class TransactionType(enum.Enum):
     """Enum for transaction types."""
     INCOME = "income"
@@ -27,7 +55,11 @@ transaction_tags = Table(
     'transaction_tags',
     Base.metadata,
     Column('transaction_id', Integer, ForeignKey('transactions.id', ondelete='CASCADE'), primary_key=True),
-    Column('tag_id', Integer, ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True)
+    Column('tag_id', Integer, ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True),
+    # The primary key leads with transaction_id; tag-side lookups (tag
+    # counts, transactions for a tag) need their own index. This keeps the
+    # association table narrow instead of copying user_id/date onto it.
+    Index('ix_transaction_tags_tag_txn', 'tag_id', 'transaction_id')
 )
 
 
@@ -35,9 +67,12 @@ class BaseModel(Base):
     """Base model with common fields."""
     __abstract__ = True
     
-    id = Column(Integer, primary_key=True, index=True)
-    created_at = Column(Date, default=lambda: date.today())
-    updated_at = Column(Date, default=lambda: date.today(), onupdate=lambda: date.today())
+    id = Column(Integer, primary_key=True)
+    # The database fills these in (see migration 0002), so inserts, bulk
+    # ones included, leave them out; SQLite has no ON UPDATE, so updated_at
+    # is still set from Python when a row changes
+    created_at = Column(Date, server_default=func.current_date())
+    updated_at = Column(Date, onupdate=date.today, server_default=func.current_date())
 
 
 class User(BaseModel):
@@ -61,16 +96,17 @@ class User(BaseModel):
     def __repr__(self):
         return f"<User(id={self.id}, name='{self.name}', email='{self.email}')>"
     
-    def to_dict(self):
+    def to_dict(self, _iso=date.isoformat):
         """Convert user to dictionary."""
+        created_at, updated_at = self.created_at, self.updated_at
         return {
             'id': self.id,
             'name': self.name,
             'email': self.email,
             'default_currency': self.default_currency,
             'monthly_income': self.monthly_income,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': _iso(created_at) if created_at else None,
+            'updated_at': _iso(updated_at) if updated_at else None
         }
 
 
@@ -96,8 +132,9 @@ class UserProfile(BaseModel):
     # One-to-one relationship
     user = relationship("User", back_populates="profile", uselist=False)
     
-    def to_dict(self) -> dict:
+    def to_dict(self, _iso=date.isoformat) -> dict:
         """Convert user profile to dictionary."""
+        created_at, updated_at = self.created_at, self.updated_at
         return {
             'id': self.id,
             'user_id': self.user_id,
@@ -110,8 +147,8 @@ class UserProfile(BaseModel):
             'currency_preference': self.currency_preference,
             'notifications_enabled': self.notifications_enabled,
             'dark_mode': self.dark_mode,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': _iso(created_at) if created_at else None,
+            'updated_at': _iso(updated_at) if updated_at else None
         }
     
     def __repr__(self):
@@ -122,6 +159,14 @@ class Transaction(BaseModel):
     """Transaction model to represent financial transactions."""
     
     __tablename__ = 'transactions'
+    __table_args__ = (
+        # Serves per-user date-range filters and newest-first listing
+        Index('ix_tx_user_date', 'user_id', 'transaction_date'),
+        # Serves per-category spend lookups for a month
+        Index('ix_tx_user_cat_date', 'user_id', 'category', 'transaction_date'),
+        # Serves income/expense totals over a date range
+        Index('ix_tx_user_type_date', 'user_id', 'transaction_type', 'transaction_date'),
+    )
     
     amount = Column(Float, nullable=False)
     description = Column(String(255), nullable=False)
@@ -135,30 +180,34 @@ class Transaction(BaseModel):
     # Relationships
     user = relationship("User", back_populates="transactions")
     
-    # Many-to-many relationship with tags
+    # Many-to-many relationship with tags; loaded with one IN query per
+    # batch of transactions so serializing a list doesn't query per row
     tags = relationship(
         'Tag',
         secondary='transaction_tags',
-        back_populates='transactions'
+        back_populates='transactions',
+        lazy='selectin'
     )
     
     def __repr__(self):
         return (f"<Transaction(id={self.id}, amount={self.amount}, "
                 f"type={self.transaction_type.value}, category='{self.category}')>")
     
-    def to_dict(self):
+    def to_dict(self, _iso=date.isoformat):
         """Convert transaction to dictionary."""
+        created_at, updated_at = self.created_at, self.updated_at
+        transaction_date = self.transaction_date
         return {
             'id': self.id,
             'amount': self.amount,
             'description': self.description,
             'category': self.category,
             'transaction_type': self.transaction_type.value,
-            'transaction_date': self.transaction_date.isoformat() if self.transaction_date else None,
+            'transaction_date': _iso(transaction_date) if transaction_date else None,
             'user_id': self.user_id,
             'tags': [tag.name for tag in self.tags],
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': _iso(created_at) if created_at else None,
+            'updated_at': _iso(updated_at) if updated_at else None
         }
 
 
@@ -178,26 +227,43 @@ class Tag(BaseModel):
         back_populates='tags'
     )
     
-    def to_dict(self) -> dict:
+    def to_dict(self, _iso=date.isoformat) -> dict:
         """Convert tag to dictionary."""
+        created_at, updated_at = self.created_at, self.updated_at
         return {
             'id': self.id,
             'name': self.name,
             'description': self.description,
             'color': self.color,
-            'transaction_count': len(self.transactions),
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'transaction_count': self.transaction_count,
+            'created_at': _iso(created_at) if created_at else None,
+            'updated_at': _iso(updated_at) if updated_at else None
         }
     
     def __repr__(self):
         return f"<Tag(name='{self.name}', color='{self.color}')>"
 
 
+# Counted in SQL rather than loading the whole transactions collection;
+# deferred so plain tag lookups don't pay for the subquery
+Tag.transaction_count = column_property(
+    select(func.count())
+    .where(transaction_tags.c.tag_id == Tag.id)
+    .correlate_except(transaction_tags)
+    .scalar_subquery(),
+    deferred=True
+)
+
+
 class Budget(BaseModel):
     """Budget model to represent monthly budgets."""
     
     __tablename__ = 'budgets'
+    __table_args__ = (
+        Index('ix_budget_user_cat_month', 'user_id', 'category', 'month'),
+        # Serves listing a user's budgets for one month
+        Index('ix_budget_user_month', 'user_id', 'month'),
+    )
     
     category = Column(String(100), nullable=False)
     limit_amount = Column(Float, nullable=False)
@@ -210,31 +276,49 @@ class Budget(BaseModel):
     # Relationship
     user = relationship("User", back_populates="budgets")
     
-    def get_spent_amount(self, transactions: List[Transaction]) -> float:
-        """Calculate amount spent in this budget category for the month."""
+    def get_spent_amount(self, source: Union[Session, List[Transaction]]) -> float:
+        """Calculate amount spent in this budget category for the month.
+        
+        source is either a session, and the sum is computed in SQL, or a
+        list of already loaded transactions, which is summed in Python.
+        """
+        # Month filters are date comparisons against the month's bounds
+        month_start, month_end = get_month_range(self.month)
+        if isinstance(source, Session):
+            return source.query(
+                func.coalesce(func.sum(Transaction.amount), 0.0)
+            ).filter(
+                Transaction.user_id == self.user_id,
+                Transaction.category == self.category,
+                Transaction.transaction_type == TransactionType.EXPENSE,
+                Transaction.transaction_date >= month_start,
+                Transaction.transaction_date < month_end
+            ).scalar()
+        
         spent = 0.0
-        for transaction in transactions:
+        for transaction in source:
             if (transaction.category == self.category and 
-                transaction.transaction_type == TransactionType.EXPENSE and
-                transaction.transaction_date.strftime("%Y-%m") == self.month):
+                transaction.transaction_type is TransactionType.EXPENSE and
+                month_start <= transaction.transaction_date < month_end):
                 spent += transaction.amount
         return spent
     
-    def get_remaining_amount(self, transactions: List[Transaction]) -> float:
+    def get_remaining_amount(self, source: Union[Session, List[Transaction]]) -> float:
         """Calculate remaining budget amount."""
-        spent = self.get_spent_amount(transactions)
+        spent = self.get_spent_amount(source)
         return self.limit_amount - spent
     
-    def is_over_budget(self, transactions: List[Transaction]) -> bool:
+    def is_over_budget(self, source: Union[Session, List[Transaction]]) -> bool:
         """Check if budget is exceeded."""
-        return self.get_remaining_amount(transactions) < 0
+        return self.get_remaining_amount(source) < 0
     
     def __repr__(self):
         return (f"<Budget(id={self.id}, category='{self.category}', "
                 f"limit={self.limit_amount}, month='{self.month}')>")
     
-    def to_dict(self):
+    def to_dict(self, _iso=date.isoformat):
         """Convert budget to dictionary."""
+        created_at, updated_at = self.created_at, self.updated_at
         return {
             'id': self.id,
             'category': self.category,
@@ -242,8 +326,8 @@ class Budget(BaseModel):
             'month': self.month,
             'description': self.description,
             'user_id': self.user_id,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': _iso(created_at) if created_at else None,
+            'updated_at': _iso(updated_at) if updated_at else None
         }
 
 
@@ -267,25 +351,54 @@ class SavingsGoal(BaseModel):
     def add_contribution(self, amount: float):
         """Add contribution to savings goal."""
         self.current_amount += amount
-        if self.current_amount >= self.target_amount:
+        # Only the first contribution that reaches the target sets the flag
+        if not self.is_achieved and self.current_amount >= self.target_amount:
             self.is_achieved = True
     
-    def get_progress_percentage(self) -> float:
-        """Calculate progress as percentage."""
+    # Hybrids so queries can select or order by these; the SQL forms use
+    # CASE so they don't depend on a backend's two-argument min/max
+    @hybrid_property
+    def progress_percentage(self) -> float:
+        """Progress towards the target as a percentage, capped at 100."""
         if self.target_amount <= 0:
             return 0.0
         return min((self.current_amount / self.target_amount) * 100, 100.0)
     
+    @progress_percentage.expression
+    def progress_percentage(cls):
+        return case(
+            (cls.target_amount <= 0, 0.0),
+            (cls.current_amount >= cls.target_amount, 100.0),
+            else_=(cls.current_amount / cls.target_amount) * 100
+        )
+    
+    @hybrid_property
+    def remaining_amount(self) -> float:
+        """Amount still needed to reach the target, never negative."""
+        return max(self.target_amount - self.current_amount, 0.0)
+    
+    @remaining_amount.expression
+    def remaining_amount(cls):
+        return case(
+            (cls.current_amount >= cls.target_amount, 0.0),
+            else_=cls.target_amount - cls.current_amount
+        )
+    
+    def get_progress_percentage(self) -> float:
+        """Calculate progress as percentage."""
+        return self.progress_percentage
+    
     def get_remaining_amount(self) -> float:
         """Calculate remaining amount to reach goal."""
-        return max(self.target_amount - self.current_amount, 0.0)
+        return self.remaining_amount
     
     def __repr__(self):
         return (f"<SavingsGoal(id={self.id}, name='{self.name}', "
                 f"target={self.target_amount}, current={self.current_amount})>")
     
-    def to_dict(self):
+    def to_dict(self, _iso=date.isoformat):
         """Convert savings goal to dictionary."""
+        created_at, updated_at = self.created_at, self.updated_at
         return {
             'id': self.id,
             'name': self.name,
@@ -293,16 +406,93 @@ class SavingsGoal(BaseModel):
             'current_amount': self.current_amount,
             'description': self.description,
             'is_achieved': self.is_achieved,
-            'progress_percentage': self.get_progress_percentage(),
-            'remaining_amount': self.get_remaining_amount(),
+            'progress_percentage': self.progress_percentage,
+            'remaining_amount': self.remaining_amount,
             'user_id': self.user_id,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': _iso(created_at) if created_at else None,
+            'updated_at': _iso(updated_at) if updated_at else None
         }
 
 
 from contextlib import contextmanager
 
+
+def get_month_range(month: str) -> Tuple[date, date]:
+    """Return the half-open [start, end) date range for a YYYY-MM month."""
+    start = datetime.strptime(month, "%Y-%m").date()
+    if start.month == 12:
+        end = date(start.year + 1, 1, 1)
+    else:
+        end = date(start.year, start.month + 1, 1)
+    return start, end
+
+
+def budget_spend_select(user_id: int, month: str):
+    """Build the per-category expense totals query for a user's month."""
+    month_start, month_end = get_month_range(month)
+    return select(
+        Transaction.category,
+        func.sum(Transaction.amount).label('spent')
+    ).where(
+        Transaction.user_id == user_id,
+        Transaction.transaction_type == TransactionType.EXPENSE,
+        Transaction.transaction_date >= month_start,
+        Transaction.transaction_date < month_end
+    ).group_by(Transaction.category)
+
+
+def insert_transactions_bulk(session: Session, rows: List[Dict], chunk: int = 500) -> int:
+    """Insert transaction dicts as executemany batches in the session's transaction."""
+    statement = insert(Transaction)
+    for start in range(0, len(rows), chunk):
+        session.execute(statement, rows[start:start + chunk])
+    return len(rows)
+
+
+def list_transactions_as_dicts(session: Session, user_id: int, limit: int = 10,
+                               offset: int = 0) -> List[Dict]:
+    """List a user's transactions newest first, shaped like Transaction.to_dict.
+    
+    Reads plain rows with Core instead of building ORM instances, and
+    fetches the page's tag names in one extra query.
+    """
+    columns = Transaction.__table__.c
+    rows = session.execute(
+        select(columns)
+        .where(columns.user_id == user_id)
+        .order_by(columns.transaction_date.desc())
+        .limit(limit)
+        .offset(offset)
+    ).all()
+    
+    tag_names = defaultdict(list)
+    if rows:
+        tag_rows = session.execute(
+            select(transaction_tags.c.transaction_id, Tag.name)
+            .join(Tag, Tag.id == transaction_tags.c.tag_id)
+            .where(transaction_tags.c.transaction_id.in_([row.id for row in rows]))
+        )
+        for transaction_id, name in tag_rows:
+            tag_names[transaction_id].append(name)
+    
+    iso = date.isoformat
+    return [
+        {
+            'id': row.id,
+            'amount': row.amount,
+            'description': row.description,
+            'category': row.category,
+            'transaction_type': row.transaction_type.value,
+            'transaction_date': iso(row.transaction_date) if row.transaction_date else None,
+            'user_id': row.user_id,
+            'tags': tag_names[row.id],
+            'created_at': iso(row.created_at) if row.created_at else None,
+            'updated_at': iso(row.updated_at) if row.updated_at else None
+        }
+        for row in rows
+    ]
+
+
 @contextmanager
 def get_db_session():
     """Get database session context manager."""
@@ -317,25 +507,49 @@ def get_db_session():
         session.close()
 
 
+@contextmanager
+def get_seed_session(bind=None):
+    """Session for the seed script, committed once on exit.
+    
+    Pass bind to run on a specific connection instead of the engine.
+    """
+    session = SeedSession(bind=bind) if bind is not None else SeedSession()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 def init_db():
     """Initialize database tables."""
     Base.metadata.create_all(bind=engine)
     print("Database initialized successfully!")
 
 
+@functools.lru_cache(maxsize=1)
+def get_alembic_config():
+    """Build the Alembic config once; shared by init and the migration commands."""
+    from alembic.config import Config
+    
+    # lib/db/models.py -> lib/db -> lib -> project_root
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    alembic_cfg = Config(os.path.join(project_root, "alembic.ini"))
+    # Set the script location to the correct path
+    alembic_cfg.set_main_option("script_location", os.path.join(project_root, "lib", "db", "migrations"))
+    return alembic_cfg
+
+
 def init_db_with_alembic():
     """Initialize database using Alembic migrations."""
-    from alembic.config import Config
     from alembic import command
-    import os
-    
-    # Get the path to alembic.ini
-    current_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    alembic_cfg = Config(os.path.join(current_dir, "alembic.ini"))
     
     try:
         # Run migrations to head
-        command.upgrade(alembic_cfg, "head")
+        command.upgrade(get_alembic_config(), "head")
         print("Database initialized with Alembic migrations!")
     except Exception as e:
         print(f"Error running Alembic migrations: {e}")
@@ -1,21 +1,20 @@
 """Database seeding utilities for the finance tracker application."""
 
-from datetime import date, datetime, timedelta
+from contextlib import contextmanager
+from datetime import date, timedelta
 import random
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
-from db.models import (
-    get_db_session, init_db, User, Transaction, Budget, SavingsGoal, 
-    TransactionType, Tag, UserProfile
+from lib.db.models import (
+    engine, get_db_session, get_seed_session, init_db, User, Transaction, Budget, SavingsGoal, 
+    TransactionType, Tag, UserProfile, transaction_tags
 )
-from helpers import format_currency
 
 
-def create_sample_users() -> List[User]:
+def create_sample_users(session: Session) -> List[User]:
     """Create sample users for testing."""
     sample_users = [
         {
@@ -51,24 +50,31 @@ def create_sample_users() -> List[User]:
     ]
     
     created_users = []
+    # Fetch every existing sample user in one query
+    existing_users = {
+        user.email: user for user in session.query(User).filter(
+            User.email.in_([user_data["email"] for user_data in sample_users])
+        )
+    }
     
-    with get_db_session() as session:
-        for user_data in sample_users:
-            # Check if user already exists
-            existing_user = session.query(User).filter_by(email=user_data["email"]).first()
-            if existing_user:
-                created_users.append(existing_user)
-                continue
-            
-            user = User(**user_data)
-            session.add(user)
-            session.flush()  # Get the ID
-            created_users.append(user)
+    for user_data in sample_users:
+        # Check if user already exists
+        existing_user = existing_users.get(user_data["email"])
+        if existing_user:
+            created_users.append(existing_user)
+            continue
+        
+        user = User(**user_data)
+        session.add(user)
+        created_users.append(user)
+    
+    # One flush inserts every new user and fills in their IDs
+    session.flush()
     
     return created_users
 
 
-def create_sample_user_profiles(users: List[User]) -> List[UserProfile]:
+def create_sample_user_profiles(session: Session, users: List[User]) -> List[UserProfile]:
     """Create sample user profiles."""
     profile_data = [
         {
@@ -114,25 +120,31 @@ def create_sample_user_profiles(users: List[User]) -> List[UserProfile]:
     ]
     
     created_profiles = []
+    # Fetch the profiles of all these users in one query
+    existing_profiles = {
+        profile.user_id: profile for profile in session.query(UserProfile).filter(
+            UserProfile.user_id.in_([user.id for user in users])
+        )
+    }
     
-    with get_db_session() as session:
-        for i, user in enumerate(users):
-            if i < len(profile_data):
-                # Check if profile already exists
-                existing_profile = session.query(UserProfile).filter_by(user_id=user.id).first()
-                if existing_profile:
-                    created_profiles.append(existing_profile)
-                    continue
-                
-                profile = UserProfile(user_id=user.id, **profile_data[i])
-                session.add(profile)
-                session.flush()
-                created_profiles.append(profile)
+    for i, user in enumerate(users):
+        if i < len(profile_data):
+            # Check if profile already exists
+            existing_profile = existing_profiles.get(user.id)
+            if existing_profile:
+                created_profiles.append(existing_profile)
+                continue
+            
+            profile = UserProfile(user_id=user.id, **profile_data[i])
+            session.add(profile)
+            created_profiles.append(profile)
+    
+    session.flush()
     
     return created_profiles
 
 
-def create_sample_tags() -> List[Tag]:
+def create_sample_tags(session: Session) -> List[Tag]:
     """Create sample tags for transactions."""
     tag_data = [
         {"name": "work", "description": "Work-related expenses", "color": "#007bff"},
@@ -150,163 +162,220 @@ def create_sample_tags() -> List[Tag]:
     ]
     
     created_tags = []
+    # Load the existing sample tags in one query rather than one per name
+    existing_tags = {
+        tag.name: tag for tag in session.query(Tag).filter(
+            Tag.name.in_([tag_info["name"] for tag_info in tag_data])
+        )
+    }
     
-    with get_db_session() as session:
-        for tag_info in tag_data:
-            # Check if tag already exists
-            existing_tag = session.query(Tag).filter_by(name=tag_info["name"]).first()
-            if existing_tag:
-                created_tags.append(existing_tag)
-                continue
-            
-            tag = Tag(**tag_info)
-            session.add(tag)
-            session.flush()
-            created_tags.append(tag)
+    for tag_info in tag_data:
+        # Check if tag already exists
+        existing_tag = existing_tags.get(tag_info["name"])
+        if existing_tag:
+            created_tags.append(existing_tag)
+            continue
+        
+        tag = Tag(**tag_info)
+        session.add(tag)
+        created_tags.append(tag)
+    
+    # One flush inserts every new tag and fills in the IDs used for tag links
+    session.flush()
     
     return created_tags
 
 
-def create_sample_transactions(users: List[User], tags: List[Tag]) -> List[Transaction]:
-    """Create sample transactions for users."""
-    
-    # Common transaction categories and amounts
-    income_categories = [
-        ("Salary", [3000, 5000, 4500, 6000]),
-        ("Freelance", [500, 1500, 800, 1200]),
-        ("Bonus", [1000, 2000, 1500]),
-        ("Investment", [100, 500, 300, 200])
-    ]
-    
-    expense_categories = [
-        ("Rent", [1200, 1500, 1800, 2000]),
-        ("Groceries", [150, 300, 200, 250]),
-        ("Gas", [40, 80, 60, 70]),
-        ("Utilities", [100, 150, 120, 180]),
-        ("Internet", [50, 80, 60]),
-        ("Phone", [30, 50, 40]),
-        ("Dining", [25, 75, 50, 100]),
-        ("Entertainment", [20, 100, 50, 80]),
-        ("Shopping", [50, 200, 100, 150]),
-        ("Health", [50, 300, 100, 200]),
-        ("Transportation", [30, 100, 50, 80]),
-        ("Coffee", [5, 15, 10, 8]),
-        ("Gym", [30, 50, 40]),
-        ("Subscription", [10, 20, 15])
-    ]
-    
-    created_transactions = []
-    
-    with get_db_session() as session:
-        for user in users:
-            # Generate transactions for the last 6 months
-            start_date = date.today() - timedelta(days=180)
-            current_date = start_date
+# Sample data tables used by create_sample_transactions
+_DESCRIPTIONS = {
+    "Rent": ["Monthly rent payment", "Rent for apartment"],
+    "Groceries": ["Weekly shopping", "Grocery store visit", "Food shopping"],
+    "Gas": ["Gas station fill-up", "Fuel for car"],
+    "Utilities": ["Electric bill", "Water bill", "Gas bill"],
+    "Dining": ["Restaurant dinner", "Lunch out", "Fast food", "Coffee shop"],
+    "Entertainment": ["Movie tickets", "Concert", "Games", "Books"],
+    "Shopping": ["Clothing", "Electronics", "Home goods", "Personal items"],
+    "Health": ["Doctor visit", "Pharmacy", "Dental", "Medical supplies"],
+    "Transportation": ["Bus fare", "Uber ride", "Taxi", "Parking"],
+    "Coffee": ["Morning coffee", "Afternoon coffee", "Coffee meeting"]
+}
+
+_TAG_MAPPING = {
+    "Groceries": ["food"],
+    "Dining": ["food"],
+    "Coffee": ["food"],
+    "Gas": ["transport"],
+    "Transportation": ["transport"],
+    "Entertainment": ["entertainment"],
+    "Shopping": ["shopping"],
+    "Health": ["health"],
+    "Utilities": ["utilities", "recurring"],
+    "Rent": ["rent", "recurring"],
+    "Internet": ["utilities", "recurring"],
+    "Phone": ["utilities", "recurring"],
+    "Gym": ["health", "recurring"],
+    "Subscription": ["recurring"]
+}
+
+_RECURRING_CATEGORIES = frozenset({"Rent", "Utilities", "Internet", "Phone", "Gym", "Subscription"})
+
+
+# Common transaction categories and amounts
+_INCOME_CATEGORIES = [
+    ("Salary", [3000, 5000, 4500, 6000]),
+    ("Freelance", [500, 1500, 800, 1200]),
+    ("Bonus", [1000, 2000, 1500]),
+    ("Investment", [100, 500, 300, 200])
+]
+
+_EXPENSE_CATEGORIES = [
+    ("Rent", [1200, 1500, 1800, 2000]),
+    ("Groceries", [150, 300, 200, 250]),
+    ("Gas", [40, 80, 60, 70]),
+    ("Utilities", [100, 150, 120, 180]),
+    ("Internet", [50, 80, 60]),
+    ("Phone", [30, 50, 40]),
+    ("Dining", [25, 75, 50, 100]),
+    ("Entertainment", [20, 100, 50, 80]),
+    ("Shopping", [50, 200, 100, 150]),
+    ("Health", [50, 300, 100, 200]),
+    ("Transportation", [30, 100, 50, 80]),
+    ("Coffee", [5, 15, 10, 8]),
+    ("Gym", [30, 50, 40]),
+    ("Subscription", [10, 20, 15])
+]
+
+
+def _generate_rows_for_user(user_id: int, dates: List[date], payday_mask: List[bool],
+                            tag_ids: Dict[str, int],
+                            rng: random.Random) -> Tuple[List[Dict], List[List[int]]]:
+    """Generate transaction rows for one user over dates; no database access.
+    
+    Returns the row dicts and, in the same order, the tag ids for each row.
+    """
+    # Bound once; these run thousands of times in the loop below
+    rand, choice, choices, randint = rng.random, rng.choice, rng.choices, rng.randint
+    
+    tx_rows = []
+    tx_tag_ids = []
+    
+    for current_date, is_payday in zip(dates, payday_mask):
+        # Income transactions (1-2 per month)
+        if is_payday:  # Bi-monthly salary
+            category, amounts = choice(_INCOME_CATEGORIES)
+            amount = choice(amounts)
+            
+            row_tag_ids = []
+            
+            # Add random tags
+            if category == "Salary":
+                work_tag_id = tag_ids.get("work")
+                recurring_tag_id = tag_ids.get("recurring")
+                if work_tag_id:
+                    row_tag_ids.append(work_tag_id)
+                if recurring_tag_id:
+                    row_tag_ids.append(recurring_tag_id)
+            
+            tx_rows.append(dict(
+                amount=amount,
+                category=category,
+                description=f"Monthly {category.lower()}",
+                transaction_type=TransactionType.INCOME,
+                transaction_date=current_date,
+                user_id=user_id
+            ))
+            tx_tag_ids.append(row_tag_ids)
+        
+        # Expense transactions (3-8 per week)
+        if rand() < 0.7:  # 70% chance of expense on any day
+            num_expenses = randint(1, 3)
             
-            while current_date <= date.today():
-                # Income transactions (1-2 per month)
-                if current_date.day in [1, 15]:  # Bi-monthly salary
-                    category, amounts = random.choice(income_categories)
-                    amount = random.choice(amounts)
-                    
-                    transaction = Transaction(
-                        amount=amount,
-                        category=category,
-                        description=f"Monthly {category.lower()}",
-                        transaction_type=TransactionType.INCOME,
-                        transaction_date=current_date,
-                        user_id=user.id
-                    )
-                    
-                    # Add random tags
-                    if category == "Salary":
-                        work_tag = next((t for t in tags if t.name == "work"), None)
-                        recurring_tag = next((t for t in tags if t.name == "recurring"), None)
-                        if work_tag:
-                            transaction.tags.append(work_tag)
-                        if recurring_tag:
-                            transaction.tags.append(recurring_tag)
-                    
-                    session.add(transaction)
-                    created_transactions.append(transaction)
+            # All of the day's categories drawn in one call
+            for category, amounts in choices(_EXPENSE_CATEGORIES, k=num_expenses):
+                amount = choice(amounts)
                 
-                # Expense transactions (3-8 per week)
-                if random.random() < 0.7:  # 70% chance of expense on any day
-                    num_expenses = random.randint(1, 3)
-                    
-                    for _ in range(num_expenses):
-                        category, amounts = random.choice(expense_categories)
-                        amount = random.choice(amounts)
-                        
-                        descriptions = {
-                            "Rent": ["Monthly rent payment", "Rent for apartment"],
-                            "Groceries": ["Weekly shopping", "Grocery store visit", "Food shopping"],
-                            "Gas": ["Gas station fill-up", "Fuel for car"],
-                            "Utilities": ["Electric bill", "Water bill", "Gas bill"],
-                            "Dining": ["Restaurant dinner", "Lunch out", "Fast food", "Coffee shop"],
-                            "Entertainment": ["Movie tickets", "Concert", "Games", "Books"],
-                            "Shopping": ["Clothing", "Electronics", "Home goods", "Personal items"],
-                            "Health": ["Doctor visit", "Pharmacy", "Dental", "Medical supplies"],
-                            "Transportation": ["Bus fare", "Uber ride", "Taxi", "Parking"],
-                            "Coffee": ["Morning coffee", "Afternoon coffee", "Coffee meeting"]
-                        }
-                        
-                        desc_options = descriptions.get(category, [f"{category} expense"])
-                        description = random.choice(desc_options)
-                        
-                        transaction = Transaction(
-                            amount=amount,
-                            category=category,
-                            description=description,
-                            transaction_type=TransactionType.EXPENSE,
-                            transaction_date=current_date,
-                            user_id=user.id
-                        )
-                        
-                        # Add appropriate tags
-                        tag_mapping = {
-                            "Groceries": ["food"],
-                            "Dining": ["food"],
-                            "Coffee": ["food"],
-                            "Gas": ["transport"],
-                            "Transportation": ["transport"],
-                            "Entertainment": ["entertainment"],
-                            "Shopping": ["shopping"],
-                            "Health": ["health"],
-                            "Utilities": ["utilities", "recurring"],
-                            "Rent": ["rent", "recurring"],
-                            "Internet": ["utilities", "recurring"],
-                            "Phone": ["utilities", "recurring"],
-                            "Gym": ["health", "recurring"],
-                            "Subscription": ["recurring"]
-                        }
-                        
-                        tag_names = tag_mapping.get(category, [])
-                        for tag_name in tag_names:
-                            tag = next((t for t in tags if t.name == tag_name), None)
-                            if tag:
-                                transaction.tags.append(tag)
-                        
-                        # Add one-time or recurring tag
-                        if category in ["Rent", "Utilities", "Internet", "Phone", "Gym", "Subscription"]:
-                            recurring_tag = next((t for t in tags if t.name == "recurring"), None)
-                            if recurring_tag and recurring_tag not in transaction.tags:
-                                transaction.tags.append(recurring_tag)
-                        else:
-                            one_time_tag = next((t for t in tags if t.name == "one-time"), None)
-                            if one_time_tag and random.random() < 0.3:
-                                transaction.tags.append(one_time_tag)
-                        
-                        session.add(transaction)
-                        created_transactions.append(transaction)
+                desc_options = _DESCRIPTIONS.get(category, [f"{category} expense"])
+                description = choice(desc_options)
                 
-                current_date += timedelta(days=1)
+                row_tag_ids = []
+                
+                # Add appropriate tags
+                tag_names = _TAG_MAPPING.get(category, [])
+                for tag_name in tag_names:
+                    tag_id = tag_ids.get(tag_name)
+                    if tag_id:
+                        row_tag_ids.append(tag_id)
+                
+                # Add one-time or recurring tag
+                if category in _RECURRING_CATEGORIES:
+                    recurring_tag_id = tag_ids.get("recurring")
+                    if recurring_tag_id and recurring_tag_id not in row_tag_ids:
+                        row_tag_ids.append(recurring_tag_id)
+                else:
+                    one_time_tag_id = tag_ids.get("one-time")
+                    if one_time_tag_id and rand() < 0.3:
+                        row_tag_ids.append(one_time_tag_id)
+                
+                tx_rows.append(dict(
+                    amount=amount,
+                    category=category,
+                    description=description,
+                    transaction_type=TransactionType.EXPENSE,
+                    transaction_date=current_date,
+                    user_id=user_id
+                ))
+                tx_tag_ids.append(row_tag_ids)
+    
+    return tx_rows, tx_tag_ids
+
+
+def create_sample_transactions(session: Session, users: List[User], tags: List[Tag],
+                               rng: Optional[random.Random] = None,
+                               today: Optional[date] = None) -> List[int]:
+    """Create sample transactions for users and return their ids.
+    
+    Rows are built as plain dicts and written with one batched INSERT per
+    user, followed by one INSERT for all of that user's tag links.
+    RETURNING is not asked for parameter order: SQLite has no sentinel for
+    it, so SQLAlchemy would fall back to one INSERT per row.
+    """
+    rng = rng or random.Random()
+    today = today or date.today()
+    
+    created_transactions = []
+    tag_ids = {tag.name: tag.id for tag in tags}
+    
+    # The last 6 months of dates and which are paydays, shared by every user
+    dates = [today - timedelta(days=180 - i) for i in range(181)]
+    payday_mask = [current_date.day in (1, 15) for current_date in dates]
+    
+    for user in users:
+        tx_rows, tx_tag_ids = _generate_rows_for_user(user.id, dates, payday_mask, tag_ids, rng)
+        if not tx_rows:
+            continue
+        
+        # SQLite gives each new INTEGER PRIMARY KEY a higher value than the
+        # last, in the order the rows are inserted, so the sorted ids line
+        # up with tx_rows and tx_tag_ids
+        tx_ids = sorted(session.scalars(insert(Transaction).returning(Transaction.id), tx_rows))
+        assoc_rows = [
+            {"transaction_id": tx_id, "tag_id": tag_id}
+            for tx_id, row_tag_ids in zip(tx_ids, tx_tag_ids)
+            for tag_id in row_tag_ids
+        ]
+        if assoc_rows:
+            session.execute(insert(transaction_tags), assoc_rows)
+        created_transactions.extend(tx_ids)
     
     return created_transactions
 
 
-def create_sample_budgets(users: List[User]) -> List[Budget]:
+def create_sample_budgets(session: Session, users: List[User],
+                          rng: Optional[random.Random] = None,
+                          today: Optional[date] = None) -> List[Budget]:
     """Create sample budgets for users."""
+    rng = rng or random.Random()
+    today = today or date.today()
     
     budget_templates = [
         {"category": "Groceries", "limit": 400},
@@ -319,47 +388,54 @@ def create_sample_budgets(users: List[User]) -> List[Budget]:
     ]
     
     created_budgets = []
-    current_month = date.today().strftime("%Y-%m")
+    budget_rows = []
+    current_month = today.strftime("%Y-%m")
+    # This month's budgets for all these users, keyed as the check below needs
+    existing_budgets = {
+        (budget.user_id, budget.category): budget
+        for budget in session.query(Budget).filter(
+            Budget.user_id.in_([user.id for user in users]),
+            Budget.month == current_month
+        )
+    }
     
-    with get_db_session() as session:
-        for user in users:
-            # Create 3-5 random budgets per user
-            num_budgets = random.randint(3, 5)
-            selected_budgets = random.sample(budget_templates, num_budgets)
+    for user in users:
+        # Create 3-5 random budgets per user
+        num_budgets = rng.randint(3, 5)
+        selected_budgets = rng.sample(budget_templates, num_budgets)
+        
+        for budget_template in selected_budgets:
+            # Check if budget already exists
+            existing_budget = existing_budgets.get((user.id, budget_template["category"]))
             
-            for budget_template in selected_budgets:
-                # Check if budget already exists
-                existing_budget = session.query(Budget).filter_by(
-                    user_id=user.id,
-                    category=budget_template["category"],
-                    month=current_month
-                ).first()
-                
-                if existing_budget:
-                    created_budgets.append(existing_budget)
-                    continue
-                
-                # Add some variation to the budget limit
-                base_limit = budget_template["limit"]
-                variation = random.uniform(0.8, 1.2)  # ±20% variation
-                limit = round(base_limit * variation, 2)
-                
-                budget = Budget(
-                    category=budget_template["category"],
-                    limit_amount=limit,
-                    month=current_month,
-                    description=f"Monthly budget for {budget_template['category'].lower()}",
-                    user_id=user.id
-                )
-                
-                session.add(budget)
-                created_budgets.append(budget)
+            if existing_budget:
+                created_budgets.append(existing_budget)
+                continue
+            
+            # Add some variation to the budget limit
+            base_limit = budget_template["limit"]
+            variation = rng.uniform(0.8, 1.2)  # ±20% variation
+            limit = round(base_limit * variation, 2)
+            
+            budget_rows.append(dict(
+                category=budget_template["category"],
+                limit_amount=limit,
+                month=current_month,
+                description=f"Monthly budget for {budget_template['category'].lower()}",
+                user_id=user.id
+            ))
+    
+    # One batched INSERT; RETURNING the entity still hands back Budget objects
+    if budget_rows:
+        created_budgets.extend(session.scalars(insert(Budget).returning(Budget), budget_rows))
     
     return created_budgets
 
 
-def create_sample_savings_goals(users: List[User]) -> List[SavingsGoal]:
+def create_sample_savings_goals(session: Session, users: List[User],
+                                rng: Optional[random.Random] = None) -> List[SavingsGoal]:
     """Create sample savings goals for users."""
+    rng = rng or random.Random()
     
     goal_templates = [
         {"name": "Emergency Fund", "target": 10000, "description": "6 months of expenses"},
@@ -373,94 +449,113 @@ def create_sample_savings_goals(users: List[User]) -> List[SavingsGoal]:
     ]
     
     created_goals = []
+    goal_rows = []
+    # Goals for all these users in one query, keyed by (user_id, name)
+    existing_goals = {
+        (goal.user_id, goal.name): goal
+        for goal in session.query(SavingsGoal).filter(
+            SavingsGoal.user_id.in_([user.id for user in users])
+        )
+    }
     
-    with get_db_session() as session:
-        for user in users:
-            # Create 2-4 random goals per user
-            num_goals = random.randint(2, 4)
-            selected_goals = random.sample(goal_templates, num_goals)
+    for user in users:
+        # Create 2-4 random goals per user
+        num_goals = rng.randint(2, 4)
+        selected_goals = rng.sample(goal_templates, num_goals)
+        
+        for goal_template in selected_goals:
+            # Check if goal already exists
+            existing_goal = existing_goals.get((user.id, goal_template["name"]))
             
-            for goal_template in selected_goals:
-                # Check if goal already exists
-                existing_goal = session.query(SavingsGoal).filter_by(
-                    user_id=user.id,
-                    name=goal_template["name"]
-                ).first()
-                
-                if existing_goal:
-                    created_goals.append(existing_goal)
-                    continue
-                
-                # Add some variation to target amount
-                base_target = goal_template["target"]
-                variation = random.uniform(0.8, 1.3)  # ±20-30% variation
-                target = round(base_target * variation, 2)
-                
-                # Random current progress (0-80% of target)
-                progress_percentage = random.uniform(0, 0.8)
-                current_amount = round(target * progress_percentage, 2)
-                
-                goal = SavingsGoal(
-                    name=goal_template["name"],
-                    target_amount=target,
-                    current_amount=current_amount,
-                    description=goal_template["description"],
-                    is_achieved=current_amount >= target,
-                    user_id=user.id
-                )
-                
-                session.add(goal)
-                created_goals.append(goal)
+            if existing_goal:
+                created_goals.append(existing_goal)
+                continue
+            
+            # Add some variation to target amount
+            base_target = goal_template["target"]
+            variation = rng.uniform(0.8, 1.3)  # ±20-30% variation
+            target = round(base_target * variation, 2)
+            
+            # Random current progress (0-80% of target)
+            progress_percentage = rng.uniform(0, 0.8)
+            current_amount = round(target * progress_percentage, 2)
+            
+            goal_rows.append(dict(
+                name=goal_template["name"],
+                target_amount=target,
+                current_amount=current_amount,
+                description=goal_template["description"],
+                is_achieved=current_amount >= target,
+                user_id=user.id
+            ))
+    
+    # One batched INSERT; RETURNING the entity still hands back SavingsGoal objects
+    if goal_rows:
+        created_goals.extend(session.scalars(insert(SavingsGoal).returning(SavingsGoal), goal_rows))
     
     return created_goals
 
 
+@contextmanager
+def _unsynced_connection():
+    """Yield a connection with SQLite fsyncs off, restored to NORMAL afterwards.
+    
+    Sample data can always be regenerated, so a crash mid-seed losing it is
+    an acceptable trade for not waiting on the disk at commit.
+    """
+    with engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA synchronous=OFF")
+        # End the autobegun transaction so the seed session owns its own
+        connection.commit()
+        try:
+            yield connection
+        finally:
+            # Back to the engine's connect-time setting before returning to the pool
+            connection.exec_driver_sql("PRAGMA synchronous=NORMAL")
+            connection.commit()
+
+
 def seed_database(include_transactions: bool = True, include_budgets: bool = True, 
-                 include_goals: bool = True) -> Dict:
-    """Seed the database with sample data."""
+                 include_goals: bool = True, random_seed: Optional[int] = None) -> Dict:
+    """Seed the database with sample data.
+    
+    Pass random_seed to generate the same sample data on every run.
+    """
+    rng = random.Random(random_seed)
+    # One date for the whole run, so transactions and budgets agree on "now"
+    today = date.today()
     
     print("🌱 Seeding database with sample data...")
     
     # Initialize database
     init_db()
     
-    # Create sample data
-    users = create_sample_users()
-    print(f"✓ Created {len(users)} users")
-    
-    # Get fresh user instances for subsequent operations
-    with get_db_session() as session:
-        fresh_users = session.query(User).all()
-    
-    profiles = create_sample_user_profiles(fresh_users)
-    print(f"✓ Created {len(profiles)} user profiles")
-    
-    tags = create_sample_tags()
-    print(f"✓ Created {len(tags)} tags")
-    
-    # Get fresh instances again
-    with get_db_session() as session:
-        fresh_users = session.query(User).all()
-        fresh_tags = session.query(Tag).all()
-    
-    transactions = []
-    if include_transactions:
-        transactions = create_sample_transactions(fresh_users, fresh_tags)
-        print(f"✓ Created {len(transactions)} transactions")
-    
-    budgets = []
-    if include_budgets:
-        with get_db_session() as session:
-            fresh_users = session.query(User).all()
-        budgets = create_sample_budgets(fresh_users)
-        print(f"✓ Created {len(budgets)} budgets")
-    
-    goals = []
-    if include_goals:
-        with get_db_session() as session:
-            fresh_users = session.query(User).all()
-        goals = create_sample_savings_goals(fresh_users)
-        print(f"✓ Created {len(goals)} savings goals")
+    # Every step shares one session that commits once on exit, so the
+    # objects created early stay attached for the later steps
+    with _unsynced_connection() as connection, get_seed_session(connection) as session:
+        users = create_sample_users(session)
+        print(f"✓ Created {len(users)} users")
+        
+        profiles = create_sample_user_profiles(session, users)
+        print(f"✓ Created {len(profiles)} user profiles")
+        
+        tags = create_sample_tags(session)
+        print(f"✓ Created {len(tags)} tags")
+        
+        transactions = []
+        if include_transactions:
+            transactions = create_sample_transactions(session, users, tags, rng, today)
+            print(f"✓ Created {len(transactions)} transactions")
+        
+        budgets = []
+        if include_budgets:
+            budgets = create_sample_budgets(session, users, rng, today)
+            print(f"✓ Created {len(budgets)} budgets")
+        
+        goals = []
+        if include_goals:
+            goals = create_sample_savings_goals(session, users, rng)
+            print(f"✓ Created {len(goals)} savings goals")
     
     summary = {
         "users": len(users),
@@ -483,13 +578,11 @@ def clear_database():
     print("⚠️  Clearing all database data...")
     
     with get_db_session() as session:
-        # Delete in proper order to respect foreign key constraints
-        session.query(UserProfile).delete()
-        session.query(SavingsGoal).delete()
-        session.query(Budget).delete()
-        session.query(Transaction).delete()
-        session.query(Tag).delete()
-        session.query(User).delete()
+        # Delete in proper order to respect foreign key constraints; the
+        # session holds no objects, so skip syncing it with each DELETE
+        session.execute(transaction_tags.delete())
+        for model in (UserProfile, SavingsGoal, Budget, Transaction, Tag, User):
+            session.query(model).delete(synchronize_session=False)
     
     print("✓ Database cleared")
 
@@ -513,7 +606,7 @@ if __name__ == "__main__":
         elif command == "reset":
             reset_and_seed()
         else:
-            print("Usage: python seed.py [seed|clear|reset]")
+            print("Usage: python -m lib.db.seed [seed|clear|reset]")
     else:
         # Default action
         seed_database()
\ No newline at end of file
@@ -0,0 +1,727 @@
+"""Finance tracker operations used by the CLI commands."""
+
+from contextlib import contextmanager
+from datetime import datetime, date
+from typing import List, Dict, Tuple, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload
+
+from rich.console import Console
+from rich.table import Table
+from rich.style import Style
+from rich.text import Text
+
+from lib.db.models import (
+    SessionLocal, get_db_session, get_month_range, budget_spend_select,
+    insert_transactions_bulk, list_transactions_as_dicts, User, Transaction,
+    Budget, SavingsGoal, TransactionType, Tag, UserProfile
+)
+from lib.helpers import format_currency, format_percentage
+
+
+# Table cells are built as Text with these shared styles, so Rich never
+# has to run its markup parser over them
+_STYLE_GREEN = Style(color="green")
+_STYLE_RED = Style(color="red")
+_STYLE_YELLOW = Style(color="yellow")
+_STYLE_BLUE = Style(color="blue")
+
+# Progress bars are sliced from these instead of multiplying strings per row
+_BAR_WIDTH = 25
+_BAR_FILLED = "█" * _BAR_WIDTH
+_BAR_EMPTY = "░" * _BAR_WIDTH
+
+
+# Exact-case keys cover the usual inputs without building a lowercased copy
+_TT_MAP = {
+    "income": TransactionType.INCOME,
+    "expense": TransactionType.EXPENSE,
+    "INCOME": TransactionType.INCOME,
+    "EXPENSE": TransactionType.EXPENSE,
+}
+
+
+def parse_transaction_type(value: str) -> TransactionType:
+    """Map 'income'/'expense' (any case) to a TransactionType."""
+    trans_type = _TT_MAP.get(value) or _TT_MAP.get(value.lower())
+    if trans_type is None:
+        raise ValueError(f"Unknown transaction type '{value}', expected 'income' or 'expense'")
+    return trans_type
+
+
+def _make_transactions_table(limit: int) -> Table:
+    """Create the recent transactions table with its columns configured."""
+    table = Table(title=f"Recent {limit} Transactions", show_header=True, header_style="bold magenta")
+    table.add_column("Date", style="cyan", width=12)
+    table.add_column("Type", style="yellow", width=8)
+    table.add_column("Amount", style="green", width=12, justify="right")
+    table.add_column("Category", style="blue", width=15)
+    table.add_column("Description", style="white", width=20)
+    table.add_column("Tags", style="purple", width=15)
+    return table
+
+
+def _make_budgets_table(month: str) -> Table:
+    """Create the budget overview table with its columns configured."""
+    table = Table(title=f"Budget Overview for {month}", show_header=True, header_style="bold magenta")
+    table.add_column("Category", style="cyan", width=15)
+    table.add_column("Budget", style="blue", width=12, justify="right")
+    table.add_column("Spent", style="yellow", width=12, justify="right")
+    table.add_column("Remaining", style="green", width=12, justify="right")
+    table.add_column("Progress", style="purple", width=12, justify="center")
+    table.add_column("Status", style="white", width=10, justify="center")
+    return table
+
+
+def _make_goals_table() -> Table:
+    """Create the savings goals table with its columns configured."""
+    table = Table(title="Savings Goals", show_header=True, header_style="bold magenta")
+    table.add_column("Goal", style="cyan", width=20)
+    table.add_column("Target", style="blue", width=12, justify="right")
+    table.add_column("Current", style="green", width=12, justify="right")
+    table.add_column("Progress", style="purple", width=30)
+    table.add_column("Status", style="white", width=10, justify="center")
+    return table
+
+
+def _bar_segments(percentage: float) -> Tuple[int, Style]:
+    """Return the number of filled bar cells and the bar style for a percentage."""
+    filled_length = int(_BAR_WIDTH * percentage / 100)
+    if percentage >= 100:
+        return filled_length, _STYLE_GREEN
+    if percentage >= 75:
+        return filled_length, _STYLE_YELLOW
+    if percentage >= 50:
+        return filled_length, _STYLE_BLUE
+    return filled_length, _STYLE_RED
+
+
+class FinanceTrackerCLI:
+    """Main CLI class for finance tracker operations.
+    
+    Used as a context manager, one session is shared by every method call
+    and committed once on exit; otherwise each call opens its own session.
+    """
+    
+    def __init__(self, session: Optional[Session] = None):
+        self.current_user_id = None
+        self.current_user = None
+        self._session = session
+        self._owns_session = False
+        self._console = None
+    
+    @property
+    def console(self) -> Console:
+        """Rich console, created on first output."""
+        if self._console is None:
+            # Skip Rich's regex highlighter; all styling is explicit
+            self._console = Console(highlight=False)
+        return self._console
+    
+    def __enter__(self):
+        if self._session is None:
+            self._session = SessionLocal()
+            self._owns_session = True
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if not self._owns_session:
+            return
+        try:
+            if exc_type is None:
+                self._session.commit()
+            else:
+                self._session.rollback()
+        finally:
+            self._session.close()
+            self._session = None
+            self._owns_session = False
+    
+    def commit(self):
+        """Commit pending work on the shared session, if there is one."""
+        if self._session is not None:
+            self._session.commit()
+    
+    @contextmanager
+    def _session_scope(self):
+        """Yield the shared session, or a short-lived one outside a with block."""
+        if self._session is None:
+            with get_db_session() as session:
+                yield session
+            return
+        
+        try:
+            yield self._session
+            self._session.flush()
+        except Exception:
+            self._session.rollback()
+            raise
+    
+    def get_or_create_user(self, name: str, email: str) -> User:
+        """Get existing user or create new one."""
+        with self._session_scope() as session:
+            user = session.query(User).filter_by(email=email).first()
+            if not user:
+                user = User(name=name, email=email)
+                session.add(user)
+                session.flush()
+                user_id = user.id
+                user_name = user.name
+                self.console.print(f"[green]Created new user: {name} ({email})[/green]")
+            else:
+                user_id = user.id
+                user_name = user.name
+                self.console.print(f"[blue]Welcome back, {user.name}![/blue]")
+            
+            self.current_user_id = user_id
+            return user
+    
+    def add_transaction(self, amount: float, category: str, description: str, 
+                       transaction_type: str, transaction_date: date = None) -> bool:
+        """Add a new transaction."""
+        if not self.current_user_id:
+            self.console.print("[red]Error: No user logged in[/red]")
+            return False
+        
+        try:
+            with self._session_scope() as session:
+                trans_type = parse_transaction_type(transaction_type)
+                
+                transaction = Transaction(
+                    amount=amount,
+                    category=category,
+                    description=description,
+                    transaction_type=trans_type,
+                    transaction_date=transaction_date or date.today(),
+                    user_id=self.current_user_id
+                )
+                
+                session.add(transaction)
+                self.console.print(f"[green]✓ {transaction_type.capitalize()} of {format_currency(amount)} added to {category}[/green]")
+                return True
+                
+        except Exception as e:
+            self.console.print(f"[red]Error adding transaction: {str(e)}[/red]")
+            return False
+    
+    def add_transactions_bulk(self, rows: List[Dict]) -> int:
+        """Add many transactions at once and return how many were added."""
+        if not self.current_user_id:
+            self.console.print("[red]Error: No user logged in[/red]")
+            return 0
+        
+        if not rows:
+            return 0
+        
+        try:
+            with self._session_scope() as session:
+                # Batched executemany INSERTs from plain dicts, committed once
+                count = insert_transactions_bulk(
+                    session, [dict(row, user_id=self.current_user_id) for row in rows]
+                )
+                self.console.print(f"[green]✓ Imported {count} transactions[/green]")
+                return count
+                
+        except Exception as e:
+            self.console.print(f"[red]Error importing transactions: {str(e)}[/red]")
+            return 0
+    
+    def view_transactions(self, limit: int = 10) -> List[Dict]:
+        """View recent transactions."""
+        if not self.current_user_id:
+            self.console.print("[red]Error: No user logged in[/red]")
+            return []
+        
+        try:
+            with self._session_scope() as session:
+                # Plain dicts straight from Core rows; the table only reads them
+                transaction_list = list_transactions_as_dicts(
+                    session, self.current_user_id, limit
+                )
+                
+                table = _make_transactions_table(limit)
+                
+                income = TransactionType.INCOME.value
+                for transaction in transaction_list:
+                    type_style = _STYLE_GREEN if transaction['transaction_type'] == income else _STYLE_RED
+                    
+                    table.add_row(
+                        # Already YYYY-MM-DD, as format_date would render it
+                        Text(transaction['transaction_date']),
+                        Text(transaction['transaction_type'], style=type_style),
+                        Text(format_currency(transaction['amount']), style=type_style),
+                        Text(transaction['category']),
+                        Text(transaction['description']),
+                        Text(", ".join(transaction['tags']))
+                    )
+                
+                if not transaction_list:
+                    self.console.print("[yellow]No transactions found.[/yellow]")
+                    return []
+                
+                self.console.print(table)
+                return transaction_list
+                
+        except Exception as e:
+            self.console.print(f"[red]Error viewing transactions: {str(e)}[/red]")
+            return []
+    
+    def add_budget(self, category: str, limit_amount: float, month: str = None) -> bool:
+        """Add or update a budget."""
+        if not self.current_user_id:
+            self.console.print("[red]Error: No user logged in[/red]")
+            return False
+        
+        if not month:
+            month = datetime.now().strftime("%Y-%m")
+        
+        try:
+            with self._session_scope() as session:
+                # Remove existing budget for this category and month
+                existing_budget = session.query(Budget).filter_by(
+                    user_id=self.current_user_id,
+                    category=category,
+                    month=month
+                ).first()
+                
+                if existing_budget:
+                    existing_budget.limit_amount = limit_amount
+                    self.console.print(f"[green]✓ Updated budget for {category} to {format_currency(limit_amount)}[/green]")
+                else:
+                    budget = Budget(
+                        category=category,
+                        limit_amount=limit_amount,
+                        month=month,
+                        user_id=self.current_user_id
+                    )
+                    session.add(budget)
+                    self.console.print(f"[green]✓ Budget of {format_currency(limit_amount)} set for {category}[/green]")
+                
+                return True
+                
+        except Exception as e:
+            self.console.print(f"[red]Error adding budget: {str(e)}[/red]")
+            return False
+    
+    def view_budgets(self, month: str = None) -> List[Dict]:
+        """View budgets and spending."""
+        if not self.current_user_id:
+            self.console.print("[red]Error: No user logged in[/red]")
+            return []
+        
+        if not month:
+            month = datetime.now().strftime("%Y-%m")
+        
+        try:
+            with self._session_scope() as session:
+                # Expense totals per category for the month, summed in SQL
+                spent_subquery = budget_spend_select(self.current_user_id, month).subquery()
+                
+                # Plain rows are enough here; nothing below needs Budget instances
+                budgets = session.execute(
+                    select(
+                        Budget.__table__,
+                        func.coalesce(spent_subquery.c.spent, 0.0).label('spent')
+                    ).outerjoin(
+                        spent_subquery, spent_subquery.c.category == Budget.category
+                    ).where(
+                        Budget.user_id == self.current_user_id,
+                        Budget.month == month
+                    )
+                ).all()
+                
+                if not budgets:
+                    self.console.print(f"[yellow]No budgets set for {month}.[/yellow]")
+                    return []
+                
+                table = _make_budgets_table(month)
+                
+                budget_list = []
+                iso = date.isoformat
+                for budget in budgets:
+                    spent = budget.spent
+                    remaining = budget.limit_amount - spent
+                    progress_pct = (spent / budget.limit_amount) * 100 if budget.limit_amount > 0 else 0
+                    
+                    if remaining >= 0:
+                        status = Text("✓ Good", style=_STYLE_GREEN)
+                        remaining_style = _STYLE_GREEN
+                    else:
+                        status = Text("⚠ Over", style=_STYLE_RED)
+                        remaining_style = _STYLE_RED
+                    
+                    table.add_row(
+                        Text(budget.category),
+                        Text(format_currency(budget.limit_amount)),
+                        Text(format_currency(spent), style=_STYLE_YELLOW),
+                        Text(format_currency(remaining), style=remaining_style),
+                        Text(f"{progress_pct:.1f}%"),
+                        status
+                    )
+                    
+                    budget_data = dict(budget._mapping)
+                    created_at, updated_at = budget.created_at, budget.updated_at
+                    budget_data['created_at'] = iso(created_at) if created_at else None
+                    budget_data['updated_at'] = iso(updated_at) if updated_at else None
+                    budget_data['remaining'] = remaining
+                    budget_list.append(budget_data)
+                
+                self.console.print(table)
+                return budget_list
+                
+        except Exception as e:
+            self.console.print(f"[red]Error viewing budgets: {str(e)}[/red]")
+            return []
+    
+    def add_savings_goal(self, name: str, target_amount: float, description: str = "") -> bool:
+        """Add a new savings goal."""
+        if not self.current_user_id:
+            self.console.print("[red]Error: No user logged in[/red]")
+            return False
+        
+        try:
+            with self._session_scope() as session:
+                goal = SavingsGoal(
+                    name=name,
+                    target_amount=target_amount,
+                    description=description,
+                    user_id=self.current_user_id
+                )
+                
+                session.add(goal)
+                self.console.print(f"[green]✓ Savings goal '{name}' of {format_currency(target_amount)} created[/green]")
+                return True
+                
+        except Exception as e:
+            self.console.print(f"[red]Error adding savings goal: {str(e)}[/red]")
+            return False
+    
+    def update_savings_goal(self, name: str, amount: float) -> bool:
+        """Update progress on a savings goal."""
+        if not self.current_user_id:
+            self.console.print("[red]Error: No user logged in[/red]")
+            return False
+        
+        try:
+            with self._session_scope() as session:
+                goal = session.query(SavingsGoal).filter_by(
+                    user_id=self.current_user_id,
+                    name=name
+                ).first()
+                
+                if not goal:
+                    self.console.print(f"[yellow]Savings goal '{name}' not found[/yellow]")
+                    return False
+                
+                goal.add_contribution(amount)
+                self.console.print(f"[green]✓ Added {format_currency(amount)} to '{goal.name}' savings goal[/green]")
+                self.console.print(f"Progress: {format_currency(goal.current_amount)} / "
+                          f"{format_currency(goal.target_amount)} "
+                          f"({format_percentage(goal.progress_percentage)})")
+                
+                if goal.is_achieved:
+                    self.console.print("[green]🎉 Congratulations! Goal achieved![/green]")
+                
+                return True
+                
+        except Exception as e:
+            self.console.print(f"[red]Error updating savings goal: {str(e)}[/red]")
+            return False
+    
+    def view_savings_goals(self) -> List[Dict]:
+        """View all savings goals."""
+        if not self.current_user_id:
+            self.console.print("[red]Error: No user logged in[/red]")
+            return []
+        
+        try:
+            with self._session_scope() as session:
+                goals = session.query(SavingsGoal).filter_by(
+                    user_id=self.current_user_id
+                ).all()
+                
+                if not goals:
+                    self.console.print("[yellow]No savings goals set.[/yellow]")
+                    return []
+                
+                table = _make_goals_table()
+                
+                goals_list = []
+                for goal in goals:
+                    progress_pct = goal.progress_percentage
+                    
+                    # Create progress bar
+                    progress_bar = self._create_progress_bar(progress_pct)
+                    
+                    if goal.is_achieved:
+                        status = Text("✓ Complete", style=_STYLE_GREEN)
+                    else:
+                        status = Text(format_percentage(progress_pct))
+                    
+                    table.add_row(
+                        Text(goal.name),
+                        Text(format_currency(goal.target_amount)),
+                        Text(format_currency(goal.current_amount), style=_STYLE_GREEN),
+                        progress_bar,
+                        status
+                    )
+                    
+                    goals_list.append(goal.to_dict())
+                
+                self.console.print(table)
+                return goals_list
+                
+        except Exception as e:
+            self.console.print(f"[red]Error viewing savings goals: {str(e)}[/red]")
+            return []
+    
+    def generate_report(self, month: str = None) -> Dict:
+        """Generate comprehensive financial report."""
+        if not self.current_user_id:
+            self.console.print("[red]Error: No user logged in[/red]")
+            return {}
+        
+        if not month:
+            month = datetime.now().strftime("%Y-%m")
+        
+        try:
+            with self._session_scope() as session:
+                month_start, month_end = get_month_range(month)
+                
+                # Aggregate the month's transactions per category and type in SQL,
+                # largest totals first so the breakdowns need no sorting here
+                total = func.sum(Transaction.amount).label('total')
+                rows = session.execute(
+                    select(
+                        Transaction.category,
+                        Transaction.transaction_type,
+                        total,
+                        func.count()
+                    ).where(
+                        Transaction.user_id == self.current_user_id,
+                        Transaction.transaction_date >= month_start,
+                        Transaction.transaction_date < month_end
+                    ).group_by(
+                        Transaction.category, Transaction.transaction_type
+                    ).order_by(total.desc())
+                ).all()
+                
+                if not rows:
+                    self.console.print(f"[yellow]No transactions found for {month}[/yellow]")
+                    return {}
+                
+                # Category breakdown straight from the grouped rows
+                category_expenses = {}
+                category_income = {}
+                transactions_count = 0
+                income = TransactionType.INCOME
+                
+                for category, transaction_type, total, count in rows:
+                    if transaction_type is income:
+                        category_income[category] = total
+                    else:
+                        category_expenses[category] = total
+                    transactions_count += count
+                
+                total_income = sum(category_income.values())
+                total_expenses = sum(category_expenses.values())
+                net_income = total_income - total_expenses
+                
+                # Display report, collected into one print rather than one per line
+                net_color = "green" if net_income >= 0 else "red"
+                lines = [
+                    f"\n[bold magenta]--- Financial Report for {month} ---[/bold magenta]",
+                    f"[cyan]Total Income:[/cyan]   {format_currency(total_income)}",
+                    f"[red]Total Expenses:[/red] {format_currency(total_expenses)}",
+                    f"[{net_color}]Net Income:[/{net_color}]     {format_currency(net_income)}"
+                ]
+                
+                if category_expenses:
+                    lines.append(f"\n[bold]--- Expenses by Category ---[/bold]")
+                    for category, amount in category_expenses.items():
+                        percentage = (amount / total_expenses) * 100 if total_expenses > 0 else 0
+                        lines.append(f"[yellow]{category:<15}[/yellow] {format_currency(amount):>12} "
+                                     f"([cyan]{format_percentage(percentage)}[/cyan])")
+                
+                if category_income:
+                    lines.append(f"\n[bold]--- Income by Category ---[/bold]")
+                    for category, amount in category_income.items():
+                        percentage = (amount / total_income) * 100 if total_income > 0 else 0
+                        lines.append(f"[green]{category:<15}[/green] {format_currency(amount):>12} "
+                                     f"([cyan]{format_percentage(percentage)}[/cyan])")
+                
+                self.console.print("\n".join(lines))
+                
+                # Return data as dict (using dicts as required)
+                report_data = {
+                    'month': month,
+                    'total_income': total_income,
+                    'total_expenses': total_expenses,
+                    'net_income': net_income,
+                    'category_expenses': category_expenses,
+                    'category_income': category_income,
+                    'transactions_count': transactions_count
+                }
+                
+                return report_data
+                
+        except Exception as e:
+            self.console.print(f"[red]Error generating report: {str(e)}[/red]")
+            return {}
+    
+    def _create_progress_bar(self, percentage: float) -> Text:
+        """Create a visual progress bar for Rich display."""
+        filled_length, bar_style = _bar_segments(percentage)
+        bar = _BAR_FILLED[:filled_length] + _BAR_EMPTY[filled_length:]
+        return Text.assemble((bar, bar_style), f" {percentage:.1f}%")
+    
+    def add_tag(self, name: str, description: str = "", color: str = "#007bff") -> bool:
+        """Add a new tag."""
+        try:
+            with self._session_scope() as session:
+                # Check if tag already exists
+                existing_tag = session.query(Tag).filter_by(name=name).first()
+                if existing_tag:
+                    self.console.print(f"[yellow]Tag '{name}' already exists.[/yellow]")
+                    return False
+                
+                tag = Tag(name=name, description=description, color=color)
+                session.add(tag)
+                self.console.print(f"[green]✓ Tag '{name}' created successfully.[/green]")
+                return True
+        except Exception as e:
+            self.console.print(f"[red]Error adding tag: {str(e)}[/red]")
+            return False
+    
+    def add_transaction_with_tags(self, amount: float, category: str, description: str, 
+                                  transaction_type: str, tag_names: List[str] = None, 
+                                  transaction_date: date = None) -> bool:
+        """Add a transaction with tags."""
+        if not self.current_user_id:
+            self.console.print("[red]Error: No user logged in[/red]")
+            return False
+        
+        try:
+            with self._session_scope() as session:
+                trans_type = parse_transaction_type(transaction_type)
+                
+                transaction = Transaction(
+                    amount=amount,
+                    category=category,
+                    description=description,
+                    transaction_type=trans_type,
+                    transaction_date=transaction_date or date.today(),
+                    user_id=self.current_user_id
+                )
+                
+                # Add tags if provided, fetching all of them in a single query
+                if tag_names:
+                    found = {tag.name: tag for tag in session.query(Tag).filter(Tag.name.in_(tag_names))}
+                    missing = [name for name in tag_names if name not in found]
+                    transaction.tags.extend(found[name] for name in dict.fromkeys(tag_names) if name in found)
+                    if missing:
+                        self.console.print(f"[yellow]Warning: Tags not found, skipping: {', '.join(missing)}[/yellow]")
+                
+                session.add(transaction)
+                tags_str = ", ".join(tag_names) if tag_names else "none"
+                self.console.print(f"[green]✓ {transaction_type.capitalize()} of {format_currency(amount)} added to {category} with tags: {tags_str}[/green]")
+                return True
+                
+        except Exception as e:
+            self.console.print(f"[red]Error adding transaction: {str(e)}[/red]")
+            return False
+    
+    def create_user_profile(self, phone: str = None, address: str = None, occupation: str = None, 
+                           annual_income: float = None, financial_goal: str = None, 
+                           risk_tolerance: str = None) -> bool:
+        """Create or update user profile, touching only the fields given."""
+        if not self.current_user_id:
+            self.console.print("[red]Error: No user logged in[/red]")
+            return False
+        
+        columns = {
+            'phone_number': phone,
+            'address': address,
+            'occupation': occupation,
+            'annual_income': annual_income,
+            'financial_goal': financial_goal,
+            'risk_tolerance': risk_tolerance
+        }
+        columns = {name: value for name, value in columns.items() if value is not None}
+        
+        try:
+            with self._session_scope() as session:
+                # Check if profile already exists
+                existing_profile = session.query(UserProfile).filter_by(user_id=self.current_user_id).first()
+                
+                if existing_profile:
+                    # Update existing profile; the UPDATE covers only these columns
+                    for name, value in columns.items():
+                        setattr(existing_profile, name, value)
+                    
+                    self.console.print("[green]✓ User profile updated successfully.[/green]")
+                else:
+                    # Create new profile; omitted columns get their model defaults
+                    profile = UserProfile(user_id=self.current_user_id, **columns)
+                    session.add(profile)
+                    self.console.print("[green]✓ User profile created successfully.[/green]")
+                
+                return True
+        except Exception as e:
+            self.console.print(f"[red]Error creating/updating profile: {str(e)}[/red]")
+            return False
+    
+    def view_user_profile(self) -> Dict:
+        """View user profile information."""
+        if not self.current_user_id:
+            self.console.print("[red]Error: No user logged in[/red]")
+            return {}
+        
+        try:
+            with self._session_scope() as session:
+                # The page shows only the user and profile, so the profile is
+                # joined in and the user's collections are left unloaded
+                user = session.query(User).options(
+                    joinedload(User.profile)
+                ).filter_by(id=self.current_user_id).first()
+                
+                if not user:
+                    self.console.print("[red]User not found.[/red]")
+                    return {}
+                
+                profile = user.profile
+                
+                # Create a panel with user information
+                user_info = f"""
+[bold cyan]Name:[/bold cyan] {user.name}
+[bold cyan]Email:[/bold cyan] {user.email}
+[bold cyan]Default Currency:[/bold cyan] {user.default_currency}
+[bold cyan]Monthly Income:[/bold cyan] {format_currency(user.monthly_income)}
+"""
+                
+                if profile:
+                    profile_info = f"""
+[bold green]Phone:[/bold green] {profile.phone_number or 'Not set'}
+[bold green]Address:[/bold green] {profile.address or 'Not set'}
+[bold green]Occupation:[/bold green] {profile.occupation or 'Not set'}
+[bold green]Annual Income:[/bold green] {format_currency(profile.annual_income) if profile.annual_income is not None else 'Not set'}
+[bold green]Financial Goal:[/bold green] {profile.financial_goal or 'Not set'}
+[bold green]Risk Tolerance:[/bold green] {profile.risk_tolerance}
+[bold green]Dark Mode:[/bold green] {'Yes' if profile.dark_mode else 'No'}
+"""
+                    full_info = user_info + profile_info
+                else:
+                    full_info = user_info + "\n[yellow]No profile information available.[/yellow]"
+                
+                # Only the profile view draws a panel, so import it here
+                from rich.panel import Panel
+                
+                panel = Panel(full_info, title="[bold magenta]User Profile[/bold magenta]", border_style="blue")
+                self.console.print(panel)
+                
+                return {"user": user.to_dict(), "profile": profile.to_dict() if profile else {}}
+                
+        except Exception as e:
+            self.console.print(f"[red]Error viewing profile: {str(e)}[/red]")
+            return {}
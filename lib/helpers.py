@@ -0,0 +1,105 @@
+"""Helper utilities for the finance tracker application."""
+
+import functools
+import math
+import re
+from datetime import date
+from typing import Tuple, Union
+
+
+# Renders repeat a small set of values (0.0, the same dates, round amounts),
+# so the formatters are memoized; every argument they take is hashable.
+@functools.lru_cache(maxsize=4096)
+def format_currency(amount: float) -> str:
+    """Format an amount as a dollar string, e.g. $1,234.50."""
+    if amount < 0:
+        return f"-${-amount:,.2f}"
+    return f"${amount:,.2f}"
+
+
+@functools.lru_cache(maxsize=4096)
+def format_date(value: date) -> str:
+    """Format a date as YYYY-MM-DD."""
+    return value.strftime("%Y-%m-%d")
+
+
+@functools.lru_cache(maxsize=4096)
+def format_percentage(percentage: float) -> str:
+    """Format a percentage with one decimal place, e.g. 42.5%."""
+    return f"{percentage:.1f}%"
+
+
+# Validators return (True, cleaned_value) or (False, error_message)
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def validate_amount(amount: str) -> Tuple[bool, Union[float, str]]:
+    """Validate a positive monetary amount, allowing thousands separators."""
+    try:
+        # Parsed once here; callers pass the float straight through to the model
+        value = float(amount.replace(',', '')) if isinstance(amount, str) else float(amount)
+    except (TypeError, ValueError):
+        return False, "Amount must be a valid number"
+    if not math.isfinite(value):
+        return False, "Amount must be a valid number"
+    if value <= 0:
+        return False, "Amount must be greater than zero"
+    return True, value
+
+
+def validate_email(email: str) -> Tuple[bool, str]:
+    """Validate an email address and normalize it to lowercase."""
+    email = email.strip().lower()
+    if len(email) > 255 or not _EMAIL_RE.match(email):
+        return False, "Please enter a valid email address"
+    return True, email
+
+
+def validate_category(category: str) -> Tuple[bool, str]:
+    """Validate a transaction or budget category name."""
+    category = category.strip()
+    if not category:
+        return False, "Category cannot be empty"
+    if len(category) > 100:
+        return False, "Category must be 100 characters or fewer"
+    return True, category
+
+
+def validate_name(name: str) -> Tuple[bool, str]:
+    """Validate a person or savings goal name."""
+    name = name.strip()
+    if not name:
+        return False, "Name cannot be empty"
+    if len(name) > 100:
+        return False, "Name must be 100 characters or fewer"
+    return True, name
+
+
+def validate_description(description: str) -> Tuple[bool, str]:
+    """Validate an optional description."""
+    description = description.strip()
+    if len(description) > 255:
+        return False, "Description must be 255 characters or fewer"
+    return True, description
+
+
+def validate_date(value: str) -> Tuple[bool, Union[date, str]]:
+    """Validate a YYYY-MM-DD date string and return it as a date."""
+    value = value.strip()
+    # Checked by hand: cheaper than a regex, and fromisoformat does the rest
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        return False, "Date must be in YYYY-MM-DD format"
+    try:
+        return True, date.fromisoformat(value)
+    except ValueError:
+        return False, "Date must be in YYYY-MM-DD format"
+
+
+def validate_month(month: str) -> Tuple[bool, str]:
+    """Validate a YYYY-MM month string."""
+    month = month.strip()
+    if (len(month) == 7 and month[4] == "-" and month[:4].isdecimal()
+            and month[5:].isdecimal() and 1 <= int(month[5:]) <= 12):
+        return True, month
+    return False, "Month must be in YYYY-MM format"